@@ -185,6 +185,9 @@ class EnhancedGenericRenderer(BaseRenderer):
         
         super().__init__(screen, self.title_font, self.regular_font, self.small_font, colors)
         
+        # Colors before module-specific ones are applied, restored by set_module
+        self._base_colors = dict(self.colors)
+        
         # Initialize component cache
         self.render_cache = RenderCache(max_size=200, ttl=2.0)
         
@@ -272,6 +275,22 @@ class EnhancedGenericRenderer(BaseRenderer):
             self.scale_for_resolution = lambda val, old_dim, new_dim: int(val * new_dim / old_dim)
             self.maintain_aspect_ratio = lambda w, h, tw=None, th=None: (tw, int(tw * h / w)) if tw else (int(th * w / h), th)
     
+    def set_module(self, module_id):
+        """Switch the renderer to another module.
+        
+        Fonts, layout and the component factory stay resident; only the
+        module-specific colors, cached surfaces and last state are reset.
+        
+        Args:
+            module_id: ID of the module to render
+        """
+        self.module_id = module_id
+        self.colors = dict(self._base_colors)
+        self._apply_module_colors(module_id)
+        self.render_cache.clear()
+        self.last_state = None
+        logger.info(f"Switched EnhancedGenericRenderer to module {module_id}")
+    
     def _apply_module_colors(self, module_id):
         """Apply module-specific colors if available."""
         if not HAS_MODULE_COLORS:
@@ -701,6 +701,68 @@ class ThemeComponentRenderer(EnhancedGenericRenderer):
         
         return surface, screen_rect
     
+    def render_progress_batch(self, bars):
+        """Render several themed progress bars with batched fills.
+        
+        Opaque bars are drawn straight onto the screen, grouped by color and
+        corner radius, which avoids building an intermediate surface per bar:
+        square bars as plain rectangle fills, rounded ones (including the
+        themes' pill bars) with one draw.rect call each. Only bars that need
+        transparency fall back to render_progress.
+        
+        Args:
+            bars: Iterable of (position, size, value, variant) tuples
+            
+        Returns:
+            List of screen rects covered by the bars
+        """
+        backgrounds = {}
+        fills = {}
+        rects = []
+        
+        for position, size, value, variant in bars:
+            style = self.theme_provider.get_style("progress", variant, None)
+            bg_color = style.get("backgroundColor", (50, 50, 50))
+            fill_color = style.get("fillColor", (0, 255, 0))
+            border_radius = self.scale_for_resolution(
+                style.get("borderRadius", 0), 
+                self.height, 
+                self.actual_height
+            )
+            opaque = (
+                style.get("opacity", 1.0) >= 1.0
+                and (len(bg_color) == 3 or bg_color[3] >= 255)
+                and (len(fill_color) == 3 or fill_color[3] >= 255)
+            )
+            
+            if not opaque:
+                _, rect = self.render_progress(position, size, value, variant)
+                rects.append(rect)
+                continue
+            
+            rect = pygame.Rect(self.scale_position(*position), self.scale_size(*size))
+            backgrounds.setdefault((tuple(bg_color), border_radius), []).append(rect)
+            
+            fill_width = int(rect.width * max(0.0, min(1.0, value)))
+            if fill_width > 0:
+                fills.setdefault((tuple(fill_color), border_radius), []).append(
+                    pygame.Rect(rect.x, rect.y, fill_width, rect.height)
+                )
+            rects.append(rect)
+        
+        # Draw all backgrounds before any fill so fills always end up on top
+        screen = self.screen
+        for groups in (backgrounds, fills):
+            for (color, border_radius), color_rects in groups.items():
+                if border_radius > 0:
+                    for rect in color_rects:
+                        pygame.draw.rect(screen, color, rect, border_radius=border_radius)
+                else:
+                    for rect in color_rects:
+                        screen.fill(color, rect)
+        
+        return rects
+    
     def render_container(self, position, size, children=None, variant=None, state=None, **kwargs):
         """Render themed container with optional child components.
         
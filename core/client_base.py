@@ -78,6 +78,7 @@ class BaseClient(ABC):
         self.sio.on('session_joined', self._on_session_joined)
         self.sio.on('state_update', self._on_state_update)
         self.sio.on('state_delta', self._on_state_delta)
+        self.sio.on('state_update_batch', self._on_state_update_batch)
         self.sio.on('round_completed', self._on_round_completed)
         self.sio.on('input_processed', self._on_input_processed)
         self.sio.on('sequence', self._on_sequence)
@@ -312,6 +313,21 @@ class BaseClient(ABC):
         
         self.on_state_delta(data)
     
+    def _on_state_update_batch(self, items: List[Dict[str, Any]]) -> None:
+        """Handle several updates the server coalesced into one frame.
+        
+        Args:
+            items: List of {'event', 'data'} entries in send order
+        """
+        handlers = {
+            'state_update': self._on_state_update,
+            'state_delta': self._on_state_delta,
+        }
+        for item in items:
+            handler = handlers.get(item.get('event'))
+            if handler is not None:
+                handler(item.get('data'))
+    
     def _on_round_completed(self, data: Dict[str, Any]) -> None:
         """Handle round completed notification.
         
@@ -153,12 +153,23 @@ class RootComponent(Container):
     def is_dirty(self):
         return True
 
+def _set_mounted(root, mounted):
+    """Set the mounted flag on every component in a tree.
+    
+    Walks the tree with an explicit stack so deep trees cannot hit the
+    recursion limit. Children lists are read directly rather than copied
+    through get_children, which leaf components do not have.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        node._mounted = mounted
+        children = getattr(node, "children", None)
+        if children:
+            stack.extend(children)
+
 def mount_component_tree(root):
-    root._mounted = True
-    for child in root.get_children():
-        mount_component_tree(child)
+    _set_mounted(root, True)
 
 def unmount_component_tree(root):
-    root._mounted = False
-    for child in root.get_children():
-        unmount_component_tree(child)
\ No newline at end of file
+    _set_mounted(root, False)
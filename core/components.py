@@ -75,6 +75,19 @@ class ComponentPool:
             self.pool[component_type].append(component)
             self.stats['returned'] += 1
     
+    def release_all(self, components):
+        """Return components and all of their descendants to the pool.
+        
+        Args:
+            components: Iterable of root components to return
+        """
+        stack = list(components)
+        while stack:
+            component = stack.pop()
+            # Collect children before reset() drops them
+            stack.extend(component.children)
+            self.release(component)
+    
     def clear(self):
         """Clear the pool."""
         self.pool.clear()
@@ -90,7 +103,7 @@ class ComponentPool:
         Returns:
             Dictionary with pool statistics
         """
-        total = self.stats['created']
+        total = self.stats['created'] + self.stats['reused']
         reuse_rate = self.stats['reused'] / total if total > 0 else 0
         return {
             'size': sum(len(items) for items in self.pool.values()),
@@ -123,6 +136,12 @@ def get_component_stats():
 class Component:
     """Base component class for UI elements."""
     
+    # Fixed attribute layout; components are created in bulk and pooled
+    __slots__ = (
+        'id', 'type', 'properties', 'position', 'created_at', 'parent',
+        'children', '_has_changed', '_cached_dict', '__weakref__'
+    )
+    
     # Cache for serialized components
     _serialization_cache = {}
     _cache_hits = 0
@@ -365,8 +384,16 @@ class UI:
         self.components.append(component)
         return self
     
-    def clear(self):
-        """Clear all components."""
+    def clear(self, release=False):
+        """Clear all components.
+        
+        Args:
+            release: Return the cleared components to the component pool so
+                the next build reuses them. Only pass True when nothing else
+                still holds references to the components.
+        """
+        if release:
+            _component_pool.release_all(self.components)
         self.components = []
     
     def to_dict(self):
@@ -83,6 +83,21 @@ class RenderBackend(ABC):
         """
         pass
         
+    def draw_rectangles(self, rects: List[Tuple[int, int, int, int]],
+                       color: Tuple[int, int, int, int], filled: bool = True) -> None:
+        """Draw several rectangles of the same color.
+        
+        Backends override this when they can draw a batch faster than
+        one draw_rectangle call per rectangle.
+        
+        Args:
+            rects: Rectangles as (x, y, width, height)
+            color: Fill color (RGBA)
+            filled: Whether to fill the rectangles (default True)
+        """
+        for x, y, width, height in rects:
+            self.draw_rectangle(x, y, width, height, color, filled)
+        
     @abstractmethod
     def draw_rounded_rectangle(self, x: int, y: int, width: int, height: int,
                               color: Tuple[int, int, int, int], radius: int = 5,
@@ -346,6 +361,27 @@ class PygameBackend(RenderBackend):
 
         self.render_stats["draw_calls"] += 1
     
+    def draw_rectangles(self, rects: List[Tuple[int, int, int, int]],
+                       color: Tuple[int, int, int, int], filled: bool = True) -> None:
+        """Draw several rectangles of the same color.
+        
+        Opaque filled rectangles go straight to Surface.fill with the color
+        resolved once; anything else falls back to draw_rectangle.
+        """
+        if not self.initialized:
+            return
+        
+        if not filled or (len(color) > 3 and color[3] < 255):
+            super().draw_rectangles(rects, color, filled)
+            return
+        
+        fill = self.screen.fill
+        rgb = color[:3]
+        for rect in rects:
+            fill(rgb, rect)
+        
+        self.render_stats["draw_calls"] += len(rects)
+    
     def draw_rounded_rectangle(self, x: int, y: int, width: int, height: int,
                               color: Tuple[int, int, int, int], radius: int = 5,
                               border_color: Optional[Tuple[int, int, int, int]] = None,
@@ -835,6 +871,19 @@ class Renderer:
             color = args[2]
             self.draw_ui_element(element_type, rect, color, **kwargs)
     
+    def queue_rectangles(self, rects: List[Tuple[int, int, int, int]],
+                        color: Tuple[int, int, int, int], filled: bool = True):
+        """Queue several rectangles of the same color in one call.
+        
+        Args:
+            rects: Rectangles as (x, y, width, height)
+            color: Fill color (RGBA)
+            filled: Whether to fill the rectangles (default True)
+        """
+        # Executed immediately, like queue_render
+        if self.backend:
+            self.backend.draw_rectangles(rects, color, filled)
+    
     def flush_queue(self):
         """Flush the render queue (stub for compatibility)."""
         pass
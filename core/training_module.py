@@ -321,6 +321,11 @@ class TrainingModule(ABC):
     SCREEN_WIDTH = SCREEN_WIDTH
     SCREEN_HEIGHT = SCREEN_HEIGHT
     
+    # Whether build_ui returns the previous build's components to the pool.
+    # Pooled components are reset in place, so only enable this in modules
+    # where nothing (subclass or renderer) keeps references to them
+    RELEASE_UI_COMPONENTS = False
+    
     @classmethod
     def configure_display(cls, width, height):
         """Configure the display settings for all modules.
@@ -422,7 +427,8 @@ class TrainingModule(ABC):
         Returns:
             UI: The UI instance with components
         """
-        self.ui.clear()
+        # Opted-in modules let the factories reuse the previous build's components
+        self.ui.clear(release=self.RELEASE_UI_COMPONENTS)
         
         # Add module name
         self.ui.add_component(self.ui.text(
@@ -9,6 +9,7 @@ import pygame
 from pathlib import Path
 import sys
 import os
+from collections import OrderedDict
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -38,6 +39,10 @@ class UIRenderer:
         
         # Initialize fonts
         self._init_fonts()
+        
+        # Rendered text surfaces keyed by (text, font_key, color), LRU ordered
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 512
     
     def _init_fonts(self):
         """Initialize font objects based on config settings."""
@@ -48,6 +53,31 @@ class UIRenderer:
             size = config.calc_font_size(font_settings["size_factor"], self.height)
             self.fonts[font_key] = pygame.font.SysFont(name, size)
     
+    def _render_text_surface(self, text, font_key, color):
+        """
+        Get the rendered surface for a string, rasterizing it only once.
+        
+        Args:
+            text: Text to render
+            font_key: Font key from config
+            color: Text color
+            
+        Returns:
+            pygame.Surface with the rendered text
+        """
+        key = (text, font_key, tuple(color))
+        text_cache = self._text_cache
+        surface = text_cache.get(key)
+        if surface is None:
+            font = self.fonts.get(font_key, self.fonts["regular"])
+            surface = font.render(text, True, color)
+            text_cache[key] = surface
+            if len(text_cache) > self._text_cache_size:
+                text_cache.popitem(last=False)
+        else:
+            text_cache.move_to_end(key)
+        return surface
+    
     def render_layout(self):
         """Render the basic layout with header, content and footer areas."""
         # Fill background
@@ -162,11 +192,8 @@ class UIRenderer:
         if color is None:
             color = config.COLORS["text"]
         
-        # Get font
-        font = self.fonts.get(font_key, self.fonts["regular"])
-        
         # Render text
-        text_surface = font.render(str(text), True, color)
+        text_surface = self._render_text_surface(str(text), font_key, color)
         
         # Position based on alignment
         text_rect = text_surface.get_rect()
@@ -297,18 +324,17 @@ class UIRenderer:
         if color is None:
             color = config.UI_THEME["colors"]["text_light"]
         
-        # Get font
-        font = self.fonts.get(font_key, self.fonts["regular"])
+        text = str(text)
         
         # Render text with shadow
         if shadow:
             # Render shadow text (offset slightly and in black)
-            shadow_surf = font.render(str(text), True, (0, 0, 0, 160))
+            shadow_surf = self._render_text_surface(text, font_key, (0, 0, 0, 160))
             shadow_rect = shadow_surf.get_rect(center=(position[0] + 2, position[1] + 2))
             self.screen.blit(shadow_surf, shadow_rect)
         
         # Render main text
-        text_surf = font.render(str(text), True, color)
+        text_surf = self._render_text_surface(text, font_key, color)
         text_rect = text_surf.get_rect(center=position)
         self.screen.blit(text_surf, text_rect)
         
@@ -11,8 +11,9 @@ import logging
 import os
 import sys
 import inspect
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Type, Union
+from typing import Dict, List, Any, Optional, Tuple, Type, Union
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +116,32 @@ _module_class_cache = {}
 # Registry for specialized module loaders
 _module_type_loaders = {}
 
+# Guards loader registration and snapshot rebuilds
+_registry_lock = threading.Lock()
+
+# Immutable snapshot of available modules, rebuilt only when loaders change
+_snapshot: Tuple[Dict[str, Any], ...] = ()
+
+def _rebuild_snapshot() -> None:
+    """Rebuild the available-modules snapshot.
+    
+    Must be called with _registry_lock held.
+    """
+    global _snapshot
+    
+    modules = list(AVAILABLE_MODULES)
+    
+    # Add modules from specialized loaders
+    for module_type, loader in _module_type_loaders.items():
+        if hasattr(loader, 'list_modules'):
+            specialized_modules = loader.list_modules()
+            for module in specialized_modules:
+                # Add module type to identify the source
+                module['module_type'] = module_type
+                modules.append(module)
+    
+    _snapshot = tuple(modules)
+
 def register_module_type(module_type: str, loader: Any) -> bool:
     """Register a specialized loader for a module type.
     
@@ -125,15 +152,38 @@ def register_module_type(module_type: str, loader: Any) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    global _module_type_loaders
-    
-    if module_type in _module_type_loaders:
-        logger.warning(f"Module type '{module_type}' already has a registered loader")
+    with _registry_lock:
+        if module_type in _module_type_loaders:
+            logger.warning(f"Module type '{module_type}' already has a registered loader")
+        
+        _module_type_loaders[module_type] = loader
+        _rebuild_snapshot()
     
-    _module_type_loaders[module_type] = loader
     logger.info(f"Registered specialized loader for module type '{module_type}'")
     return True
 
+def unregister_module_type(module_type: str) -> bool:
+    """Unregister the specialized loader for a module type.
+    
+    Args:
+        module_type: Type of module (e.g., 'music')
+    
+    Returns:
+        True if a loader was removed, False otherwise
+    """
+    with _registry_lock:
+        if module_type not in _module_type_loaders:
+            return False
+        
+        del _module_type_loaders[module_type]
+        _rebuild_snapshot()
+    
+    logger.info(f"Unregistered specialized loader for module type '{module_type}'")
+    return True
+
+with _registry_lock:
+    _rebuild_snapshot()
+
 def configure_modules_display(width: int, height: int):
     """Configure display settings for all modules.
 
@@ -300,24 +350,16 @@ def create_module_instance(module_id: str, **kwargs) -> Optional[TrainingModule]
         return None
 
 
-def get_available_modules() -> List[Dict[str, Any]]:
-    """Get a list of available modules.
+def get_available_modules() -> Tuple[Dict[str, Any], ...]:
+    """Get the available modules.
+    
+    The result is an immutable snapshot that is only rebuilt when module
+    loaders are registered or unregistered, so it can be read without locking.
     
     Returns:
-        List of module information dictionaries
+        Tuple of module information dictionaries
     """
-    modules = AVAILABLE_MODULES.copy()
-    
-    # Add modules from specialized loaders
-    for module_type, loader in _module_type_loaders.items():
-        if hasattr(loader, 'list_modules'):
-            specialized_modules = loader.list_modules()
-            for module in specialized_modules:
-                # Add module type to identify the source
-                module['module_type'] = module_type
-                modules.append(module)
-    
-    return modules
+    return _snapshot
 
 def discover_modules_from_directory() -> List[Dict[str, Any]]:
     """Discover training modules from the modules directory.
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional, Union, Callable
 import threading
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 # Add parent directory to path for direct imports when needed
 if __name__ == "__main__" or not __package__:
@@ -30,6 +31,54 @@ logger = logging.getLogger(__name__)
 # Global audio availability flag
 AUDIO_AVAILABLE = False
 
+@lru_cache(maxsize=16)
+def _time_base(num_samples: int, sample_rate: int) -> np.ndarray:
+    """Get the sample times for a buffer of the given length.
+    
+    Notes of the same duration share one read-only array.
+    """
+    t = np.arange(num_samples, dtype=np.float64) / sample_rate
+    t.flags.writeable = False
+    return t
+
+@lru_cache(maxsize=16)
+def _adsr_envelope(total_samples: int, sample_rate: int, attack: float, decay: float,
+                   sustain: float, release: float) -> np.ndarray:
+    """Get the ADSR envelope for a buffer of the given length.
+    
+    Notes with the same length and envelope share one read-only array.
+    """
+    attack_samples = int(attack * sample_rate)
+    decay_samples = int(decay * sample_rate)
+    release_samples = int(release * sample_rate)
+    sustain_samples = total_samples - (attack_samples + decay_samples + release_samples)
+    
+    # Ensure we have some samples for each phase
+    if sustain_samples < 0:
+        attack_samples = max(1, int(total_samples * 0.1))
+        decay_samples = max(1, int(total_samples * 0.2))
+        release_samples = max(1, int(total_samples * 0.3))
+        sustain_samples = total_samples - (attack_samples + decay_samples + release_samples)
+        sustain_samples = max(0, sustain_samples)
+    
+    # Create envelope (vectorized)
+    envelope = np.zeros(total_samples)
+    
+    if attack_samples > 0:
+        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+    
+    if decay_samples > 0:
+        envelope[attack_samples:attack_samples + decay_samples] = np.linspace(1, sustain, decay_samples)
+    
+    if sustain_samples > 0:
+        envelope[attack_samples + decay_samples:attack_samples + decay_samples + sustain_samples] = sustain
+    
+    if release_samples > 0:
+        envelope[-release_samples:] = np.linspace(sustain, 0, release_samples)
+    
+    envelope.flags.writeable = False
+    return envelope
+
 # Backend detection with lazily loaded dependencies
 class AudioBackend(ABC):
     """Abstract base class for audio playback backends."""
@@ -102,6 +151,11 @@ class PyGameBackend(AudioBackend):
         self._pygame = None
         self._available = False
         self._current_sound = None
+        
+        # Conversion buffers reused across calls, grown to the longest sound
+        # played so far; make_sound copies the samples, so reuse is safe
+        self._scaled = np.empty(0)
+        self._pcm = np.empty(0, dtype=np.int16)
         self._try_load()
     
     def _try_load(self):
@@ -123,11 +177,22 @@ class PyGameBackend(AudioBackend):
             return
             
         try:
-            # Scale to int16 range
-            waveform = np.int16(waveform * 32767)
+            num_samples = len(waveform)
+            if len(self._pcm) < num_samples:
+                self._scaled = np.empty(num_samples)
+                self._pcm = np.empty(num_samples, dtype=np.int16)
+            scaled = self._scaled[:num_samples]
+            pcm = self._pcm[:num_samples]
+            
+            # Scale to int16 range, rounding and saturating instead of letting
+            # the cast truncate and wrap out-of-range samples
+            np.multiply(waveform, 32767, out=scaled)
+            np.rint(scaled, out=scaled)
+            np.clip(scaled, -32768, 32767, out=scaled)
+            pcm[:] = scaled
             
             # Create pygame Sound object
-            sound = self._pygame.sndarray.make_sound(waveform)
+            sound = self._pygame.sndarray.make_sound(pcm)
             sound.play()
             
             # Store reference to current sound
@@ -199,6 +264,10 @@ class AudioEngine:
         self.sound_cache = {}  # Dict mapping keys to waveforms
         self.cache_usage = []  # LRU tracking
         
+        # Playback timers still running, keyed by the event they will set
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        
         logger.info(f"Audio engine initialized with backend: {self.active_backend.__class__.__name__}")
         logger.info(f"Audio available: {AUDIO_AVAILABLE}")
     
@@ -227,61 +296,51 @@ class AudioEngine:
             self.cache_usage.append(cache_key)
             return self.sound_cache[cache_key]
         
-        # Generate time array (use vectorized operations for speed)
-        t = np.linspace(0, duration, int(self.sample_rate * duration), endpoint=False)
+        # Shared time array for this buffer length
+        t = _time_base(int(self.sample_rate * duration), self.sample_rate)
         
         # Initialize empty waveform
         waveform = np.zeros_like(t)
         
+        # Phase in cycles of the fundamental; each harmonic is evaluated in
+        # place in one scratch buffer instead of allocating temporaries
+        cycles = t * freq
+        harmonic = np.empty_like(t)
+        
         # Generate base waveform with overtones
         for i in range(1, overtones + 2):
             amplitude = 1.0 / i  # Diminishing amplitude for higher harmonics
-            harmonic_freq = freq * i
+            np.multiply(cycles, i, out=harmonic)
             
             # Apply waveshape
             if waveshape == "sine":
-                waveform += amplitude * np.sin(2 * np.pi * harmonic_freq * t)
+                harmonic *= 2 * np.pi
+                np.sin(harmonic, out=harmonic)
             elif waveshape == "sawtooth":
-                waveform += amplitude * (2 * (t * harmonic_freq - np.floor(0.5 + t * harmonic_freq)))
+                harmonic -= np.floor(harmonic + 0.5)
+                harmonic *= 2
             elif waveshape == "square":
-                waveform += amplitude * np.sign(np.sin(2 * np.pi * harmonic_freq * t))
+                harmonic *= 2 * np.pi
+                np.sin(harmonic, out=harmonic)
+                np.sign(harmonic, out=harmonic)
             elif waveshape == "triangle":
-                waveform += amplitude * (2 * np.abs(2 * (t * harmonic_freq - np.floor(t * harmonic_freq + 0.5))) - 1)
+                harmonic -= np.floor(harmonic + 0.5)
+                np.abs(harmonic, out=harmonic)
+                harmonic *= 4
+                harmonic -= 1
+            else:
+                continue
+            
+            harmonic *= amplitude
+            waveform += harmonic
         
         # Normalize to prevent clipping
-        waveform = waveform / np.max(np.abs(waveform))
+        waveform /= np.max(np.abs(waveform))
         
         # Apply ADSR envelope
-        total_samples = len(waveform)
-        attack_samples = int(attack * self.sample_rate)
-        decay_samples = int(decay * self.sample_rate)
-        release_samples = int(release * self.sample_rate)
-        sustain_samples = total_samples - (attack_samples + decay_samples + release_samples)
-        
-        # Ensure we have some samples for each phase
-        if sustain_samples < 0:
-            attack_samples = max(1, int(total_samples * 0.1))
-            decay_samples = max(1, int(total_samples * 0.2))
-            release_samples = max(1, int(total_samples * 0.3))
-            sustain_samples = total_samples - (attack_samples + decay_samples + release_samples)
-            sustain_samples = max(0, sustain_samples)
-        
-        # Create and apply envelope (vectorized)
-        envelope = np.zeros(total_samples)
-        
-        if attack_samples > 0:
-            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        
-        if decay_samples > 0:
-            envelope[attack_samples:attack_samples + decay_samples] = np.linspace(1, sustain, decay_samples)
-        
-        if sustain_samples > 0:
-            envelope[attack_samples + decay_samples:attack_samples + decay_samples + sustain_samples] = sustain
-        
-        if release_samples > 0:
-            envelope[-release_samples:] = np.linspace(sustain, 0, release_samples)
-        
-        final_waveform = waveform * envelope
+        envelope = _adsr_envelope(len(waveform), self.sample_rate, attack, decay, sustain, release)
+        waveform *= envelope
+        final_waveform = waveform
         
         # Cache the result (with LRU management)
         if len(self.cache_usage) >= self.cache_size_limit:
@@ -294,29 +353,69 @@ class AudioEngine:
         
         return final_waveform
     
-    def play(self, waveform: np.ndarray, volume: float = 1.0) -> None:
+    def play(self, waveform: np.ndarray, volume: float = 1.0) -> threading.Event:
         """Play a synthesized sound.
         
+        Playback is asynchronous; the returned event is set once the sound
+        has finished, or immediately when nothing is audible.
+        
         Args:
             waveform: NumPy array containing the audio waveform
             volume: Volume level (0.0 to 1.0)
+            
+        Returns:
+            Event that is set when playback has finished
         """
+        finished = threading.Event()
         if self.active_backend is None:
-            return
+            finished.set()
+            return finished
             
         # Apply volume
         scaled_waveform = waveform * volume
         
         # Play through the active backend
         self.active_backend.play(scaled_waveform, self.sample_rate)
+        
+        # Neither backend reports when a non-blocking play drains, so time it
+        # from the sample count
+        if isinstance(self.active_backend, SilentBackend):
+            finished.set()
+        else:
+            timer = threading.Timer(len(waveform) / self.sample_rate,
+                                    self._finish_playback, args=(finished,))
+            timer.daemon = True
+            with self._pending_lock:
+                self._pending[finished] = timer
+            timer.start()
+        
+        return finished
+    
+    def _finish_playback(self, finished: threading.Event) -> None:
+        """Mark a playback as finished and forget its timer."""
+        with self._pending_lock:
+            self._pending.pop(finished, None)
+        finished.set()
     
     def stop(self) -> None:
-        """Stop any currently playing audio."""
+        """Stop any currently playing audio.
+        
+        Pending playback timers are cancelled and their events set, so
+        callers waiting on a stopped sound are released right away.
+        """
         if self.active_backend is not None:
             self.active_backend.stop()
+            
+        with self._pending_lock:
+            pending = list(self._pending.items())
+            self._pending.clear()
+            
+        for finished, timer in pending:
+            timer.cancel()
+            finished.set()
     
     def play_note(self, note: str, duration: float = 0.5, volume: float = 1.0, 
-                waveshape: str = "sine") -> None:
+                waveshape: str = "sine") -> threading.Event:
         """Play a musical note by name.
         
         Args:
@@ -324,13 +423,16 @@ class AudioEngine:
             duration: Duration in seconds
             volume: Volume level (0.0 to 1.0)
             waveshape: Waveform shape
+            
+        Returns:
+            Event that is set when playback has finished
         """
         freq = self.note_to_freq(note)
         waveform = self.synthesize(freq, duration, waveshape)
-        self.play(waveform, volume)
+        return self.play(waveform, volume)
     
     def play_chord(self, notes: List[str], duration: float = 1.0, 
-                 volume: float = 1.0, waveshape: str = "sine") -> None:
+                 volume: float = 1.0, waveshape: str = "sine") -> threading.Event:
         """Play a chord (multiple notes simultaneously).
         
         Args:
@@ -338,27 +440,30 @@ class AudioEngine:
             duration: Duration in seconds
             volume: Volume level (0.0 to 1.0)
             waveshape: Waveform shape
+            
+        Returns:
+            Event that is set when playback has finished
         """
         if not notes:
-            return
+            finished = threading.Event()
+            finished.set()
+            return finished
             
-        # Synthesize each note
-        waveforms = []
-        for note in notes:
-            freq = self.note_to_freq(note)
-            waveform = self.synthesize(freq, duration, waveshape)
-            waveforms.append(waveform)
+        # Each note's waveform comes from the synthesis cache after first use,
+        # so a repeated chord is only a sum over stored tables
+        tables = np.stack([
+            self.synthesize(self.note_to_freq(note), duration, waveshape)
+            for note in notes
+        ])
         
         # Mix waveforms together
-        mixed = np.zeros_like(waveforms[0])
-        for waveform in waveforms:
-            mixed += waveform
+        mixed = tables.sum(axis=0)
             
         # Normalize to prevent clipping
-        mixed = mixed / max(1.0, np.max(np.abs(mixed)))
+        mixed /= max(1.0, np.max(np.abs(mixed)))
         
         # Play the chord
-        self.play(mixed, volume)
+        return self.play(mixed, volume)
     
     def note_to_freq(self, note: str) -> float:
         """Convert a note name to frequency in Hz.
@@ -399,14 +504,21 @@ class AudioEngine:
         return freq
     
     def play_scale(self, root_note: str, scale_name: str = "Major", 
-                 duration: float = 0.4, volume: float = 1.0) -> None:
+                 duration: float = 0.4, volume: float = 1.0) -> threading.Event:
         """Play a musical scale.
         
+        Blocks for roughly the length of the scale (each note's start offset
+        times the number of notes), so only the last note's tail is still
+        playing when it returns.
+        
         Args:
             root_note: Root note name
             scale_name: Name of the scale to play
             duration: Duration of each note
             volume: Volume level
+            
+        Returns:
+            Event that is set when playback has finished
         """
         # Define scale patterns (semitones from root)
         scales = {
@@ -419,15 +531,27 @@ class AudioEngine:
         
         pattern = scales.get(scale_name, scales["Major"])
         root_freq = self.note_to_freq(root_note)
+        freqs = root_freq * np.power(2.0, np.asarray(pattern) / 12.0)
         
-        # Play each note in the scale
-        for semitones in pattern:
-            freq = root_freq * (2 ** (semitones / 12))
-            waveform = self.synthesize(freq, duration, "sine")
-            self.play(waveform, volume)
-            
-            # Small pause between notes
-            time.sleep(duration * 0.9)
+        # Notes start slightly before the previous one ends; overlap-add them
+        # into one buffer so the whole scale is a single playback call
+        step = int(duration * 0.9 * self.sample_rate)
+        notes = [self.synthesize(float(freq), duration, "sine") for freq in freqs]
+        scale = np.zeros(step * (len(notes) - 1) + max(len(note) for note in notes))
+        for i, note in enumerate(notes):
+            scale[i * step:i * step + len(note)] += note
+        
+        # Normalize only if the overlaps pushed the peak past full scale
+        peak = np.max(np.abs(scale))
+        if peak > 1.0:
+            scale /= peak
+        
+        finished = self.play(scale, volume)
+        
+        # Block for the length of the scale, as callers expect
+        time.sleep(len(notes) * duration * 0.9)
+        
+        return finished
 
 # Wrapper class for backward compatibility
 class EnhancedAudioSynthesis:
@@ -66,6 +66,12 @@ class OptimizedRequestHandler(http.server.BaseHTTPRequestHandler):
     # Class-level cache of common responses
     static_responses = {}
     
+    def setup(self):
+        """Set up the handler and resolve the owning server instance once."""
+        super().setup()
+        self._srv = getattr(self.server, 'server_instance', None)
+        self._metrics = self._srv.metrics_collector if self._srv else None
+    
     def _send_response(self, status_code, data, cache_control=None):
         """Send a JSON response.
         
@@ -89,8 +95,8 @@ class OptimizedRequestHandler(http.server.BaseHTTPRequestHandler):
         self.wfile.write(response)
         
         # Record the request
-        if hasattr(self.server, 'server_instance'):
-            self.server.server_instance.metrics_collector.record_request()
+        if self._metrics:
+            self._metrics.record_request()
     
     def _send_error(self, status_code, message):
         """Send an error response.
@@ -104,8 +110,8 @@ class OptimizedRequestHandler(http.server.BaseHTTPRequestHandler):
         })
         
         # Record the error
-        if hasattr(self.server, 'server_instance'):
-            self.server.server_instance.metrics_collector.record_error()
+        if self._metrics:
+            self._metrics.record_error()
     
     def _parse_path(self):
         """Parse the request path.
@@ -166,14 +172,14 @@ class OptimizedRequestHandler(http.server.BaseHTTPRequestHandler):
         endpoint, params = self._parse_path()
         
         # Get server instance
-        server_instance = self.server.server_instance if hasattr(self.server, 'server_instance') else None
+        server_instance = self._srv
         
         if not server_instance:
             self._send_error(500, "Server instance not available")
             return
         
         session_manager = server_instance.session_manager
-        metrics_collector = server_instance.metrics_collector
+        metrics_collector = self._metrics
         
         try:
             # Health check endpoint
@@ -187,24 +193,26 @@ class OptimizedRequestHandler(http.server.BaseHTTPRequestHandler):
             
             # List available modules
             elif endpoint == '/api/modules':
-                # This rarely changes, so cache the response
-                if 'modules' in self.static_responses:
+                # This rarely changes, so cache the response against the
+                # registry snapshot it was encoded from
+                modules = get_available_modules()
+                cached = self.static_responses.get('modules')
+                if cached and cached[0] is modules:
                     self.send_response(200)
                     self.send_header('Content-Type', 'application/json')
                     self.send_header('Access-Control-Allow-Origin', '*')
                     self.send_header('Cache-Control', 'max-age=3600')
                     self.end_headers()
-                    self.wfile.write(self.static_responses['modules'])
+                    self.wfile.write(cached[1])
                     metrics_collector.record_request()
                 else:
-                    modules = get_available_modules()
                     response_data = {
                         'modules': modules
                     }
                     response_json = json.dumps(response_data).encode('utf-8')
                     
                     # Cache this response
-                    self.static_responses['modules'] = response_json
+                    self.static_responses['modules'] = (modules, response_json)
                     
                     self._send_response(200, response_data, cache_control='max-age=3600')
             
@@ -259,14 +267,14 @@ class OptimizedRequestHandler(http.server.BaseHTTPRequestHandler):
         data = self._parse_json_body()
         
         # Get server instance
-        server_instance = self.server.server_instance if hasattr(self.server, 'server_instance') else None
+        server_instance = self._srv
         
         if not server_instance:
             self._send_error(500, "Server instance not available")
             return
         
         session_manager = server_instance.session_manager
-        metrics_collector = server_instance.metrics_collector
+        metrics_collector = self._metrics
         
         if data is None:
             self._send_error(400, "Invalid JSON body")
@@ -13,19 +13,207 @@ Key features:
 - Performance metrics tracking
 """
 
+import copy
+import hashlib
 import json
 import logging
+import os
+import socket
+import threading
 import time
 import asyncio
+import concurrent.futures
 from typing import Dict, Any, List, Optional, Callable, Set, Tuple
 import zlib
-import base64
+
+# Try to import msgpack for compact binary serialization
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Try to import xxhash for fast state fingerprints
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# Try to import zstandard for faster compression
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Pre-trained zstd dictionary for small state payloads (see train_state_dictionary)
+DEFAULT_DICTIONARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'state_dict.bin')
+
+# Compression threshold used when a dictionary is loaded
+DICTIONARY_COMPRESSION_THRESHOLD = 64
+
+# Write buffer limits for asyncio transports (bytes)
+TRANSPORT_WRITE_BUFFER_HIGH = 1 << 20
+TRANSPORT_WRITE_BUFFER_LOW = 1 << 18
+
+# Delta operation codes: each op is (code, path, value) where path is a
+# sequence of keys from the state root
+DELTA_SET = "s"
+DELTA_DELETE = "d"
+
+# Common state field names, interned as their index in delta paths.
+# Append only: clients resolve ids against the list sent at session start.
+STATE_FIELD_NAMES = (
+    'module', 'name', 'description', 'session', 'id', 'start_time',
+    'elapsed_time', 'game', 'score', 'level', 'message', 'is_completed',
+    'ui', 'components', 'type', 'position', 'properties', 'created_at',
+    'performance', 'avg_frame_time', 'min_frame_time', 'max_frame_time',
+    'total_frames', 'fps', 'component_stats', 'accuracy', 'timestamp',
+    'state', 'phase', 'round', 'time_remaining', 'grid', 'pattern',
+    'selected', 'text', 'color', 'font_size', 'align', 'width', 'height',
+)
+
+def encode_state(data: Any) -> bytes:
+    """
+    Serialize state data to compact bytes.
+    
+    Uses MessagePack when available, otherwise compact JSON.
+    
+    Args:
+        data: Serializable data
+        
+    Returns:
+        Encoded bytes
+    """
+    if HAS_MSGPACK:
+        return msgpack.packb(data, use_bin_type=True)
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def decode_state(data: bytes) -> Any:
+    """
+    Decode bytes produced by encode_state.
+    
+    Args:
+        data: Encoded bytes
+        
+    Returns:
+        Decoded data
+    """
+    if HAS_MSGPACK:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def state_fingerprint(value: Any) -> int:
+    """
+    Compute a 64-bit fingerprint of a state sub-tree.
+    
+    Modules can cache these at mutation time and expose them through
+    get_state_fingerprints() so unchanged sub-trees are skipped when diffing.
+    
+    Args:
+        value: JSON-serializable state value
+        
+    Returns:
+        Integer fingerprint
+    """
+    data = encode_state(value)
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+def train_state_dictionary(samples: List[bytes], output_path: Optional[str] = None,
+                           dict_size: int = 16384) -> bytes:
+    """
+    Train a zstd dictionary from captured state payloads.
+    
+    Samples should be encoded payloads as returned by
+    StateSynchronizer.prepare_update (mostly deltas, some full states).
+    
+    Args:
+        samples: List of encoded payloads
+        output_path: File to write the dictionary to (defaults to DEFAULT_DICTIONARY_PATH)
+        dict_size: Maximum dictionary size in bytes
+        
+    Returns:
+        Raw dictionary bytes
+    """
+    if not HAS_ZSTD:
+        raise RuntimeError("zstandard is required to train a compression dictionary")
+        
+    dict_bytes = zstd.train_dictionary(dict_size, samples).as_bytes()
+    
+    with open(output_path or DEFAULT_DICTIONARY_PATH, 'wb') as f:
+        f.write(dict_bytes)
+        
+    logger.info(f"Trained {len(dict_bytes)} byte state dictionary from {len(samples)} samples")
+    return dict_bytes
+
+def tune_transport(environ: Dict[str, Any]) -> bool:
+    """
+    Tune a client's underlying connection for small, frequent updates.
+    
+    Disables Nagle's algorithm on the socket and raises the write buffer
+    limits of asyncio transports. The socket is looked up in the WSGI/ASGI
+    environ passed to the Socket.IO connect handler.
+    
+    Args:
+        environ: Connection environ from the Socket.IO connect event
+        
+    Returns:
+        True if a socket was found and tuned, False otherwise
+    """
+    sock = None
+    transport = None
+    
+    request = environ.get('aiohttp.request')
+    if request is not None:
+        transport = request.transport
+        if transport is not None:
+            sock = transport.get_extra_info('socket')
+    elif 'eventlet.input' in environ and hasattr(environ['eventlet.input'], 'get_socket'):
+        sock = environ['eventlet.input'].get_socket()
+    else:
+        sock = environ.get('werkzeug.socket') or environ.get('gunicorn.socket')
+        
+    if transport is not None and hasattr(transport, 'set_write_buffer_limits'):
+        transport.set_write_buffer_limits(high=TRANSPORT_WRITE_BUFFER_HIGH,
+                                          low=TRANSPORT_WRITE_BUFFER_LOW)
+        
+    if sock is None:
+        return False
+        
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not set TCP_NODELAY: {e}")
+        return False
+        
+    return True
+
+# Marker for keys missing from a dict during diffing
+_MISSING = object()
+
+def _plain_field(key: Any) -> Any:
+    """Path entry for a key when field interning is off."""
+    return key
+
 class StateSynchronizer:
     """
     Handles efficient state synchronization between server and clients.
@@ -33,18 +221,38 @@ class StateSynchronizer:
     Uses delta encoding and compression for minimal network traffic.
     """
     
-    def __init__(self, compression_threshold=512, send_full_state_interval=20):
+    def __init__(self, compression_threshold=512, send_full_state_interval=20, dictionary_path=None):
         """
         Initialize the state synchronizer.
         
         Args:
             compression_threshold: Minimum size in bytes to apply compression
             send_full_state_interval: Send full state every N updates to prevent drift
+            dictionary_path: Optional zstd dictionary file (defaults to DEFAULT_DICTIONARY_PATH)
         """
         self.clients = {}  # client_id -> {state, version, last_sync_time}
         self.compression_threshold = compression_threshold
         self.send_full_state_interval = send_full_state_interval
         
+        # Interned field names: name -> id and id -> name
+        self.field_names = list(STATE_FIELD_NAMES)
+        self.field_registry = {name: i for i, name in enumerate(self.field_names)}
+        
+        # Compression contexts (zlib is used when zstandard is unavailable)
+        self._dict = None
+        if HAS_ZSTD:
+            self._dict = self._load_dictionary(dictionary_path or DEFAULT_DICTIONARY_PATH)
+            if self._dict is not None:
+                # Dictionary compression pays off even for tiny deltas
+                self.compression_threshold = min(compression_threshold, DICTIONARY_COMPRESSION_THRESHOLD)
+            # ZstdCompressor must not be shared between threads; each thread
+            # that compresses gets its own from _compressor()
+            self._local = threading.local()
+            self._dctx = zstd.ZstdDecompressor(dict_data=self._dict)
+        else:
+            # Pristine deflate state, copied per payload instead of rebuilt
+            self._zlib_compressor = zlib.compressobj(level=6)
+        
         # Statistics
         self.stats = {
             'total_updates': 0,
@@ -53,9 +261,32 @@ class StateSynchronizer:
             'compressed_updates': 0,
             'bytes_sent': 0,
             'bytes_saved': 0,
-            'compression_ratio': 0
+            'compression_ratio': 0,
+            'suppressed_updates': 0
         }
     
+    def _load_dictionary(self, path: str) -> Optional[Any]:
+        """
+        Load a zstd compression dictionary if one exists.
+        
+        Args:
+            path: Dictionary file path
+            
+        Returns:
+            ZstdCompressionDict or None if unavailable
+        """
+        if not os.path.exists(path):
+            return None
+            
+        try:
+            with open(path, 'rb') as f:
+                dictionary = zstd.ZstdCompressionDict(f.read())
+            logger.info(f"Loaded state compression dictionary from {path}")
+            return dictionary
+        except (OSError, zstd.ZstdError) as e:
+            logger.warning(f"Could not load compression dictionary {path}: {e}")
+            return None
+    
     def register_client(self, client_id: str) -> None:
         """
         Register a new client for state synchronization.
@@ -82,79 +313,144 @@ class StateSynchronizer:
             del self.clients[client_id]
             logger.debug(f"Unregistered client {client_id}")
     
-    def compute_delta(self, previous_state: Dict[str, Any], current_state: Dict[str, Any]) -> Dict[str, Any]:
+    def compute_delta(self, previous_state: Dict[str, Any], current_state: Dict[str, Any],
+                      previous_fingerprints: Optional[Dict[str, int]] = None,
+                      current_fingerprints: Optional[Dict[str, int]] = None,
+                      intern_fields: bool = False) -> List[Tuple[str, Tuple[Any, ...], Any]]:
         """
         Compute delta between previous and current state.
         
         Args:
             previous_state: Previous state dictionary
             current_state: Current state dictionary
+            previous_fingerprints: Optional top-level key -> fingerprint for previous_state
+            current_fingerprints: Optional top-level key -> fingerprint for current_state
+            intern_fields: Build paths with interned field ids (as encode_delta would)
             
         Returns:
-            Delta dictionary with only changed values
+            List of (op code, key path, value) operations
         """
+        field = self._intern_field if intern_fields else _plain_field
+        
+        delta = []
+        if previous_state is current_state:
+            # Same object returned again, nothing to diff
+            return delta
         if not previous_state:
-            return current_state
+            delta.extend((DELTA_SET, (field(key),), value) for key, value in current_state.items())
+            return delta
+            
+        # Top-level sub-trees whose fingerprints match are unchanged
+        unchanged = ()
+        if previous_fingerprints and current_fingerprints:
+            unchanged = {key for key, fingerprint in current_fingerprints.items()
+                         if previous_fingerprints.get(key) == fingerprint}
             
-        delta = {}
-        self._compute_delta_recursive(previous_state, current_state, delta, "")
+        self._compute_delta_iter(previous_state, current_state, delta, unchanged, field)
         return delta
     
-    def _compute_delta_recursive(self, prev: Any, curr: Any, delta: Dict[str, Any], path: str) -> None:
+    def _compute_delta_iter(self, prev: Any, curr: Any, delta: List[Tuple[str, Tuple[Any, ...], Any]],
+                            unchanged: Any = (), field: Callable[[Any], Any] = None) -> None:
         """
-        Recursively compute delta between two states.
+        Compute delta between two states using an explicit stack.
         
         Args:
-            prev: Previous value
-            curr: Current value
-            delta: Output delta dictionary
-            path: Current path in the state (for nested dicts)
+            prev: Previous state
+            curr: Current state
+            delta: Output list of delta operations
+            unchanged: Top-level keys known to be unchanged
+            field: Maps a key to its path entry (defaults to the key itself)
         """
+        if field is None:
+            field = _plain_field
+            
         # Handle different types
-        if type(prev) != type(curr):
-            # Types are different, include the entire current value
-            if path:
-                delta[path] = curr
-            else:
+        if type(prev) != type(curr) or not isinstance(curr, dict):
+            if isinstance(curr, dict):
                 # Root level, copy all keys
-                for key, value in curr.items():
-                    delta[key] = value
+                delta.extend((DELTA_SET, (field(key),), value) for key, value in curr.items())
+            elif curr != prev:
+                delta.append((DELTA_SET, (), curr))
             return
             
-        # Handle dict type
-        if isinstance(curr, dict):
-            # Find keys only in current dict
-            for key in set(curr.keys()) - set(prev.keys()):
-                new_path = f"{path}.{key}" if path else key
-                delta[new_path] = curr[key]
-                
-            # Find keys in both dicts
-            for key in set(curr.keys()) & set(prev.keys()):
-                new_path = f"{path}.{key}" if path else key
-                if curr[key] != prev[key]:
-                    if isinstance(curr[key], dict) and isinstance(prev[key], dict):
-                        # Recurse for nested dicts
-                        self._compute_delta_recursive(prev[key], curr[key], delta, new_path)
-                    else:
-                        # Add changed value
-                        delta[new_path] = curr[key]
-            
-            # Keys only in previous dict are considered deleted
-            for key in set(prev.keys()) - set(curr.keys()):
-                new_path = f"{path}.{key}" if path else key
-                delta[new_path] = None  # Null indicates deletion
-                
-        # Handle non-dict type
-        elif curr != prev:
-            delta[path] = curr
+        stack = [(prev, curr, ())]
+        while stack:
+            prev, curr, path = stack.pop()
+            skip = unchanged if not path else ()
+            
+            # Single pass over the current dict: added and changed keys
+            common = 0
+            for key, curr_value in curr.items():
+                prev_value = prev.get(key, _MISSING)
+                if prev_value is _MISSING:
+                    delta.append((DELTA_SET, path + (field(key),), curr_value))
+                    continue
+                common += 1
+                if curr_value is prev_value or (skip and key in skip):
+                    continue
+                if isinstance(curr_value, dict) and isinstance(prev_value, dict):
+                    # Descend into nested dicts
+                    stack.append((prev_value, curr_value, path + (field(key),)))
+                elif curr_value != prev_value:
+                    # Add changed value
+                    delta.append((DELTA_SET, path + (field(key),), curr_value))
+            
+            # Keys only in previous dict are deleted; only scan for them when
+            # some previous key wasn't seen above
+            if common != len(prev):
+                for key in prev:
+                    if key not in curr:
+                        delta.append((DELTA_DELETE, path + (field(key),), None))
+    
+    def _intern_field(self, key: Any) -> Any:
+        """
+        Map a state key to its interned field id, or its string form if unknown.
+        
+        Args:
+            key: State key
+            
+        Returns:
+            Field id or string key
+        """
+        return self.field_registry.get(key, key if type(key) is str else str(key))
+    
+    def encode_delta(self, delta: List[Tuple[str, Tuple[Any, ...], Any]]) -> List[Tuple[str, List[Any], Any]]:
+        """
+        Replace known field names in delta paths with their interned ids.
+        
+        Path keys that aren't in the registry are sent as strings, so integer
+        path entries always refer to field_names.
+        
+        Args:
+            delta: List of delta operations from compute_delta
+            
+        Returns:
+            List of delta operations with interned paths
+        """
+        intern = self._intern_field
+        return [(op, [intern(key) for key in path], value) for op, path, value in delta]
     
-    def apply_delta(self, base_state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    def decode_delta(self, delta: List[Tuple[str, List[Any], Any]]) -> List[Tuple[str, List[Any], Any]]:
+        """
+        Resolve interned field ids in delta paths back to field names.
+        
+        Args:
+            delta: List of delta operations produced by encode_delta
+            
+        Returns:
+            List of delta operations with plain key paths
+        """
+        names = self.field_names
+        return [(op, [names[key] if type(key) is int else key for key in path], value)
+                for op, path, value in delta]
+    
+    def apply_delta(self, base_state: Dict[str, Any], delta: List[Tuple[str, Tuple[Any, ...], Any]]) -> Dict[str, Any]:
         """
         Apply delta to base state to get updated state.
         
         Args:
             base_state: Base state dictionary
-            delta: Delta dictionary with changes
+            delta: List of delta operations (the decoded 'ops' of a delta update)
             
         Returns:
             Updated state dictionary
@@ -162,189 +458,279 @@ class StateSynchronizer:
         if not delta:
             return base_state
             
-        # Make a deep copy of base state
-        result = json.loads(json.dumps(base_state))
+        # Shallow-copy the root; nested dicts are only copied along the
+        # paths the delta touches (copy-on-write), untouched sub-trees are shared
+        result = copy.copy(base_state)
+        cloned_ids = {id(result)}
+        
+        # Resolved parent nodes of the previous op: parents[i] is the node at
+        # parent_path[:i]. compute_delta emits sibling ops together, so most
+        # ops reuse their ancestors instead of walking from the root.
+        parent_path = ()
+        parents = [result]
         
-        # Apply each delta path
-        for path, value in delta.items():
-            if path == "_meta":
-                continue  # Skip metadata
+        for op, path, value in delta:
+            if not path:
+                # Whole-state replacement
+                result = value
+                parent_path = ()
+                parents = [result]
+                continue
                 
-            if "." in path:
-                # Handle nested path
-                parts = path.split(".")
-                curr = result
+            # Reuse the longest shared prefix with the previous parent path
+            depth = len(path) - 1
+            common = 0
+            limit = min(depth, len(parent_path))
+            while common < limit and path[common] == parent_path[common]:
+                common += 1
+            del parents[common + 1:]
+            curr = parents[common]
+            
+            # Navigate the rest of the way, cloning shared nodes on the way
+            for part in path[common:depth]:
+                child = curr.get(part)
+                if not isinstance(child, dict):
+                    child = {}
+                    cloned_ids.add(id(child))
+                    curr[part] = child
+                elif id(child) not in cloned_ids:
+                    child = copy.copy(child)
+                    cloned_ids.add(id(child))
+                    curr[part] = child
+                parents.append(child)
+                curr = child
+            parent_path = path[:depth]
                 
-                # Navigate to parent object
-                for part in parts[:-1]:
-                    if part not in curr:
-                        curr[part] = {}
-                    curr = curr[part]
-                    
-                # Set or delete value
-                if value is None:
-                    # Delete key
-                    if parts[-1] in curr:
-                        del curr[parts[-1]]
-                else:
-                    # Set value
-                    curr[parts[-1]] = value
+            # Set or delete value
+            if op == DELTA_DELETE:
+                curr.pop(path[-1], None)
             else:
-                # Handle top-level path
-                if value is None:
-                    # Delete key
-                    if path in result:
-                        del result[path]
-                else:
-                    # Set value
-                    result[path] = value
+                curr[path[-1]] = value
                     
         return result
     
-    def prepare_update(self, client_id: str, current_state: Dict[str, Any]) -> Tuple[Dict[str, Any], bool, bool]:
+    def _encode_full_state(self, client_data: Dict[str, Any], current_state: Dict[str, Any],
+                           revision: Optional[Any]) -> bytes:
+        """
+        Encode the full state, reusing the client's cached encoding when the
+        module revision hasn't changed.
+        
+        Args:
+            client_data: Client tracking data
+            current_state: Current full state
+            revision: Module state revision, or None if the module has none
+            
+        Returns:
+            Encoded state bytes (without metadata)
+        """
+        if revision is not None:
+            cached = client_data.get('full_cache')
+            if cached and cached[0] == revision:
+                return cached[1]
+                
+        state_bytes = encode_state(current_state)
+        
+        if revision is not None:
+            client_data['full_cache'] = (revision, state_bytes)
+            
+        return state_bytes
+    
+    def _encode_full_update(self, state_bytes: bytes, meta: Dict[str, Any]) -> bytes:
+        """
+        Build a full update {'state': ..., '_meta': ...} around already
+        encoded state bytes, without re-encoding the state.
+        
+        Args:
+            state_bytes: Encoded state from _encode_full_state
+            meta: Metadata dictionary
+            
+        Returns:
+            Encoded full update
+        """
+        state_key = encode_state('state')
+        meta_key = encode_state('_meta')
+        meta_bytes = encode_state(meta)
+        
+        if HAS_MSGPACK:
+            # fixmap header with two entries, followed by key/value pairs
+            return b'\x82' + state_key + state_bytes + meta_key + meta_bytes
+        return b'{' + state_key + b':' + state_bytes + b',' + meta_key + b':' + meta_bytes + b'}'
+    
+    def prepare_update(self, client_id: str, current_state: Dict[str, Any],
+                       revision: Optional[Any] = None,
+                       now: Optional[float] = None,
+                       fingerprints: Optional[Dict[str, int]] = None) -> Tuple[Optional[bytes], bool, bool]:
         """
         Prepare an update for a client.
         
+        The update is serialized exactly once; the encoded bytes are used both
+        for the size statistics and as the input to compress_data.
+        
         Args:
             client_id: Client identifier
             current_state: Current full state
+            revision: Optional module state revision; when the client already
+                has this revision no update is produced
+            now: Timestamp for this update (defaults to time.time())
+            fingerprints: Optional top-level key -> fingerprint for current_state
             
         Returns:
-            Tuple of (update data, is_delta, is_compressed)
+            Tuple of (encoded update payload or None if nothing needs to be
+            sent, is_delta, is_compressed)
         """
         if client_id not in self.clients:
             self.register_client(client_id)
             
         client_data = self.clients[client_id]
+        
+        # Client already has this revision
+        if (revision is not None and client_data['version'] != 0 and
+                client_data.get('revision') == revision):
+            self.stats['suppressed_updates'] += 1
+            return None, False, False
+            
+        if now is None:
+            now = time.time()
+            
         client_data['update_count'] += 1
+        client_data['revision'] = revision
         
         # Send full state periodically to prevent drift or on first update
         send_full = (client_data['update_count'] % self.send_full_state_interval == 0 or 
                     client_data['version'] == 0)
         
-        # Update statistics
-        self.stats['total_updates'] += 1
-        
-        if send_full:
-            # Full state update
-            update_data = current_state.copy()
-            update_data['_meta'] = {
-                'version': client_data['version'] + 1,
-                'is_delta': False,
-                'timestamp': time.time()
-            }
-            
-            # Calculate full data size for statistics
-            full_data_size = len(json.dumps(update_data))
-            self.stats['bytes_sent'] += full_data_size
-            self.stats['full_updates'] += 1
-            
-            # Update client state
-            client_data['state'] = update_data
-            client_data['version'] += 1
-            client_data['last_sync_time'] = time.time()
-            
-            return update_data, False, False
-        else:
+        if not send_full:
             # Delta update
-            delta = self.compute_delta(client_data['state'], current_state)
-            
-            # Add metadata
-            delta['_meta'] = {
-                'version': client_data['version'] + 1,
-                'is_delta': True,
-                'base_version': client_data['version'],
-                'timestamp': time.time()
-            }
+            # Paths are interned while diffing, so the op list is sent as-is
+            ops = self.compute_delta(client_data['state'], current_state,
+                                     client_data.get('fingerprints'), fingerprints,
+                                     intern_fields=True)
+            
+            # Nothing changed, don't send a no-op frame
+            if not ops:
+                self.stats['suppressed_updates'] += 1
+                return None, True, False
             
-            # Calculate data sizes for statistics
-            delta_size = len(json.dumps(delta))
-            full_size = len(json.dumps(current_state))
-            self.stats['bytes_saved'] += (full_size - delta_size)
-            self.stats['bytes_sent'] += delta_size
-            self.stats['delta_updates'] += 1
-            
-            # Check if full state would be smaller (rare but possible)
-            if delta_size > full_size:
-                # Full state is smaller, use that instead
-                update_data = current_state.copy()
-                update_data['_meta'] = {
+            delta = {
+                'ops': ops,
+                '_meta': {
                     'version': client_data['version'] + 1,
-                    'is_delta': False,
-                    'timestamp': time.time()
+                    'is_delta': True,
+                    'base_version': client_data['version'],
+                    'timestamp': now
                 }
+            }
+            
+            payload = encode_state(delta)
+            delta_size = len(payload)
+            
+            # Estimate the full size from the last encoded full state; only
+            # encode the current full state when the delta covers most keys
+            full_size = client_data.get('full_size', delta_size)
+            if len(ops) > len(current_state) * 0.8:
+                full_size = len(self._encode_full_state(client_data, current_state, revision))
+                client_data['full_size'] = full_size
                 
-                # Update statistics
-                self.stats['bytes_sent'] -= delta_size
-                self.stats['bytes_sent'] += full_size
-                self.stats['bytes_saved'] -= (full_size - delta_size)
-                self.stats['delta_updates'] -= 1
-                self.stats['full_updates'] += 1
+                # Full state is smaller (rare but possible), send that instead
+                send_full = delta_size > full_size
+            
+            if not send_full:
+                self.stats['total_updates'] += 1
+                self.stats['bytes_saved'] += (full_size - delta_size)
+                self.stats['bytes_sent'] += delta_size
+                self.stats['delta_updates'] += 1
                 
                 # Update client state
-                client_data['state'] = update_data
+                client_data['state'] = current_state
+                client_data['fingerprints'] = fingerprints
                 client_data['version'] += 1
-                client_data['last_sync_time'] = time.time()
+                client_data['last_sync_time'] = now
                 
-                return update_data, False, False
-                
-            # Update client state
-            client_data['state'] = current_state
-            client_data['version'] += 1
-            client_data['last_sync_time'] = time.time()
-            
-            return delta, True, False
+                return payload, True, False
+        
+        # Full state update
+        state_bytes = self._encode_full_state(client_data, current_state, revision)
+        payload = self._encode_full_update(state_bytes, {
+            'version': client_data['version'] + 1,
+            'is_delta': False,
+            'timestamp': now
+        })
+        
+        client_data['full_size'] = len(payload)
+        self.stats['total_updates'] += 1
+        self.stats['bytes_sent'] += len(payload)
+        self.stats['full_updates'] += 1
+        
+        # Update client state
+        client_data['state'] = current_state
+        client_data['fingerprints'] = fingerprints
+        client_data['version'] += 1
+        client_data['last_sync_time'] = now
+        
+        return payload, False, False
+    
+    def _compressor(self) -> Any:
+        """
+        Get the calling thread's zstd compressor, creating it on first use.
+        
+        Returns:
+            ZstdCompressor using the shared dictionary
+        """
+        cctx = getattr(self._local, 'cctx', None)
+        if cctx is None:
+            cctx = self._local.cctx = zstd.ZstdCompressor(level=3, dict_data=self._dict)
+        return cctx
     
-    def compress_data(self, data: Dict[str, Any]) -> Tuple[str, bool]:
+    def compress_data(self, payload: bytes, record_stats: bool = True) -> Tuple[bytes, bool]:
         """
-        Compress data if it's large enough.
+        Compress an encoded payload if it's large enough.
+        
+        Payloads are always returned as raw bytes so they are sent as binary
+        WebSocket frames. Safe to call from worker threads with record_stats
+        False; statistics are only updated by the calling loop thread.
         
         Args:
-            data: Data to compress
+            payload: Encoded payload from prepare_update
+            record_stats: Whether to count the compression in the statistics
             
         Returns:
-            Tuple of (compressed data string, is_compressed)
+            Tuple of (payload bytes, is_compressed)
         """
-        # Convert to JSON string
-        json_str = json.dumps(data)
-        
         # Only compress if above threshold
-        if len(json_str) < self.compression_threshold:
-            return json_str, False
+        if len(payload) < self.compression_threshold:
+            return payload, False
             
-        # Compress using zlib
-        compressed = zlib.compress(json_str.encode('utf-8'))
-        
-        # Encode as base64 for safe transmission
-        b64_data = base64.b64encode(compressed).decode('ascii')
+        # Compress using zstd, or zlib as a fallback
+        if HAS_ZSTD:
+            compressed = self._compressor().compress(payload)
+        else:
+            compressor = self._zlib_compressor.copy()
+            compressed = compressor.compress(payload) + compressor.flush()
         
         # Update statistics
-        self.stats['compressed_updates'] += 1
+        if record_stats:
+            self.stats['compressed_updates'] += 1
         
-        return b64_data, True
+        return compressed, True
     
-    def decompress_data(self, data: str, is_compressed: bool) -> Dict[str, Any]:
+    def decompress_data(self, data: bytes, is_compressed: bool) -> Dict[str, Any]:
         """
         Decompress data if it's compressed.
         
         Args:
-            data: Compressed or uncompressed data
+            data: Payload bytes as received in a binary frame
             is_compressed: Whether the data is compressed
             
         Returns:
             Decompressed data dictionary
         """
         if not is_compressed:
-            return json.loads(data)
+            return decode_state(data)
             
-        # Decode from base64
-        binary_data = base64.b64decode(data)
-        
-        # Decompress
-        decompressed = zlib.decompress(binary_data).decode('utf-8')
-        
-        # Parse JSON
-        return json.loads(decompressed)
+        # Decompress and parse JSON
+        if HAS_ZSTD:
+            return decode_state(self._dctx.decompress(data))
+        return decode_state(zlib.decompress(data))
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -369,7 +755,8 @@ class StateSynchronizer:
             'compressed_updates': 0,
             'bytes_sent': 0,
             'bytes_saved': 0,
-            'compression_ratio': 0
+            'compression_ratio': 0,
+            'suppressed_updates': 0
         }
 
 class WebSocketStateManager:
@@ -377,18 +764,31 @@ class WebSocketStateManager:
     Manages WebSocket state synchronization for training modules.
     """
     
-    def __init__(self, socketio, state_sync_interval=0.1):
+    def __init__(self, socketio, state_sync_interval=0.1, client_queue_size=64,
+                 offload_threshold=8192):
         """
         Initialize the WebSocket state manager.
         
         Args:
             socketio: SocketIO server instance
             state_sync_interval: Time interval between state updates (seconds)
+            client_queue_size: Maximum pending updates per client before the
+                pending deltas are dropped and a full state is forced
+            offload_threshold: Payload size in bytes above which compression
+                runs in the worker pool during an update cycle
         """
         self.socketio = socketio
         self.state_sync_interval = state_sync_interval
+        self.client_queue_size = client_queue_size
+        self.offload_threshold = offload_threshold
         self.synchronizer = StateSynchronizer()
         
+        # Worker pool for compressing large payloads (zstd and zlib release the GIL)
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        
+        # Outgoing update queues: client_id -> queue drained by a sender task
+        self._client_queues = {}
+        
         # Active sessions: client_id -> {module, session_id}
         self.active_sessions = {}
         
@@ -401,14 +801,20 @@ class WebSocketStateManager:
         # Logger
         self.logger = logger
     
-    def register_client(self, client_id: str) -> None:
+    def register_client(self, client_id: str, environ: Optional[Dict[str, Any]] = None) -> None:
         """
         Register a new client.
         
         Args:
             client_id: Client identifier (SocketIO SID)
+            environ: Optional connection environ from the connect handler,
+                used to tune the client's transport
         """
+        if environ is not None:
+            tune_transport(environ)
+            
         self.synchronizer.register_client(client_id)
+        self._start_sender(client_id)
         self.logger.info(f"Client {client_id} connected")
     
     def unregister_client(self, client_id: str) -> None:
@@ -422,9 +828,157 @@ class WebSocketStateManager:
         if client_id in self.active_sessions:
             self.end_session(client_id)
             
+        # Stop the sender task
+        queue = self._client_queues.pop(client_id, None)
+        if queue is not None:
+            self._close_queue(queue)
+            
         self.synchronizer.unregister_client(client_id)
         self.logger.info(f"Client {client_id} disconnected")
     
+    def _start_sender(self, client_id: str) -> Any:
+        """
+        Create a client's update queue and start its sender task.
+        
+        The queue comes from the Engine.IO server so it matches the
+        configured async mode (threading, eventlet or gevent).
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            The client's update queue
+        """
+        queue = self._client_queues.get(client_id)
+        if queue is None:
+            queue = self._engineio().create_queue(maxsize=self.client_queue_size)
+            self._client_queues[client_id] = queue
+            self.socketio.start_background_task(self._sender, client_id, queue)
+        return queue
+    
+    def _engineio(self) -> Any:
+        """
+        Get the Engine.IO server behind the SocketIO instance.
+        
+        A Flask-SocketIO SocketIO wraps a python-socketio Server in its
+        `server` attribute; only the latter exposes `eio`.
+        
+        Returns:
+            The Engine.IO server
+        """
+        return getattr(self.socketio, 'server', self.socketio).eio
+    
+    def _sender(self, client_id: str, queue: Any) -> None:
+        """
+        Emit queued updates to a client until its queue is closed.
+        
+        Everything already waiting in the queue when the sender wakes is
+        coalesced into a single 'state_update_batch' emit, a list of
+        {'event', 'data'} entries in queue order; a lone update is emitted
+        under its own event.
+        
+        Args:
+            client_id: Client identifier
+            queue: The client's update queue
+        """
+        empty = self._engineio().get_queue_empty_exception()
+        closed = False
+        while not closed:
+            item = queue.get()
+            if item is None:
+                break
+            items = [item]
+            
+            # Drain whatever else is pending into the same frame
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except empty:
+                    break
+                if item is None:
+                    closed = True
+                    break
+                items.append(item)
+            
+            # A failed emit must not stop the sender, or the queue backs up
+            try:
+                if len(items) == 1:
+                    event, message = items[0]
+                    self.socketio.emit(event, message, room=client_id)
+                else:
+                    self.socketio.emit('state_update_batch', [
+                        {'event': event, 'data': message} for event, message in items
+                    ], room=client_id)
+            except Exception as e:
+                self.logger.error(f"Error sending updates to client {client_id}: {e}")
+    
+    def _close_queue(self, queue: Any) -> None:
+        """
+        Close a client's update queue without blocking.
+        
+        Pending updates are discarded to make room for the stop sentinel, so
+        a full queue (e.g. from a stalled sender) can't block the caller.
+        
+        Args:
+            queue: The client's update queue
+        """
+        while True:
+            try:
+                queue.put_nowait(None)
+                return
+            except Exception:
+                pass
+            try:
+                queue.get_nowait()
+            except Exception:
+                pass
+    
+    def _enqueue_update(self, client_id: str, message: Dict[str, Any], event: str = 'state_update') -> None:
+        """
+        Queue an update for a client without blocking.
+        
+        A slow client only backs up its own queue; when it is full the pending
+        updates are dropped and a full state is forced on the next cycle. The
+        one-time 'state_fields' registry is never dropped, since without it
+        the client can't decode interned delta paths.
+        
+        Args:
+            client_id: Client identifier
+            message: Update message to send
+            event: Socket.IO event name
+        """
+        # The client may have disconnected since its update was prepared;
+        # starting a sender now would leak it, as nothing would close it
+        if client_id not in self.synchronizer.clients:
+            return
+            
+        queue = self._start_sender(client_id)
+        
+        try:
+            queue.put_nowait((event, message))
+            return
+        except Exception:
+            pass
+            
+        # Queue is full: drop the pending updates and force a full state next
+        # cycle, keeping the field registry and any stop sentinel in order
+        kept = []
+        while True:
+            try:
+                item = queue.get_nowait()
+            except Exception:
+                break
+            if item is None or item[0] == 'state_fields':
+                kept.append(item)
+        self.synchronizer.clients[client_id]['version'] = 0
+        
+        # The sender may drain concurrently, so the re-queue is guarded too
+        for item in kept + [(event, message)]:
+            try:
+                queue.put_nowait(item)
+            except Exception:
+                self.logger.warning(f"Dropped update for client {client_id}: queue full")
+    
     def start_session(self, client_id: str, module_instance: Any) -> Dict[str, Any]:
         """
         Start a new training session for a client.
@@ -451,6 +1005,9 @@ class WebSocketStateManager:
         
         self.last_updates[session_id] = time.time()
         
+        # Send the field name registry used to intern delta paths
+        self._enqueue_update(client_id, {'fields': self.synchronizer.field_names}, 'state_fields')
+        
         # Send initial full state
         initial_state = module_instance.get_full_state()
         
@@ -544,33 +1101,120 @@ class WebSocketStateManager:
         """
         module.update(dt)
     
-    def send_update(self, client_id: str) -> None:
+    def _get_state_snapshot(self, module: Any) -> Tuple[Dict[str, Any], Optional[Any], Optional[Dict[str, int]]]:
+        """
+        Read a module's current state, revision and fingerprints.
+        
+        Args:
+            module: TrainingModule instance
+            
+        Returns:
+            Tuple of (current state, state revision, top-level fingerprints)
+        """
+        current_state = module.get_state()
+        revision = getattr(module, 'state_revision', None)
+        fingerprints = module.get_state_fingerprints() if hasattr(module, 'get_state_fingerprints') else None
+        return current_state, revision, fingerprints
+    
+    def send_update(self, client_id: str, batch: Optional[List[Tuple[str, Any]]] = None,
+                    now: Optional[float] = None, snapshot: Optional[Tuple[Any, Any, Any]] = None,
+                    shared: Optional[Dict[bytes, Any]] = None) -> None:
         """
         Send a state update to a client.
         
         Args:
             client_id: Client identifier
+            batch: Optional list to append the (client_id, message) pair to
+                instead of emitting immediately
+            now: Timestamp for this update (defaults to time.time())
+            snapshot: Optional state snapshot from _get_state_snapshot, shared
+                by all clients of a session during an update cycle
+            shared: Optional payload -> message map shared by the clients of
+                a session, so identical payloads are compressed once
         """
         if client_id not in self.active_sessions:
             return
             
         # Get active module and current state
-        session = self.active_sessions[client_id]
-        module = session['module']
-        current_state = module.get_state()
+        if snapshot is None:
+            snapshot = self._get_state_snapshot(self.active_sessions[client_id]['module'])
+        current_state, revision, fingerprints = snapshot
         
         # Prepare update (delta or full)
-        update_data, is_delta, _ = self.synchronizer.prepare_update(client_id, current_state)
+        update_data, is_delta, _ = self.synchronizer.prepare_update(
+            client_id, current_state, revision, now, fingerprints)
         
-        # Compress if large
-        compressed_data, is_compressed = self.synchronizer.compress_data(update_data)
+        # Client is already up to date
+        if update_data is None:
+            return
+            
+        message = shared.get(update_data) if shared is not None else None
+        if message is None:
+            # Large payloads in a batched cycle are compressed in the worker pool
+            # while the loop moves on; the batch is resolved in order on flush
+            if batch is not None and len(update_data) > self.offload_threshold:
+                message = self._pool.submit(self._build_message, update_data, is_delta, False)
+            else:
+                message = self._build_message(update_data, is_delta)
+            if shared is not None:
+                shared[update_data] = message
+        
+        if batch is not None:
+            batch.append((client_id, message))
+            return
+            
+        # Hand off to the client's sender task
+        self._enqueue_update(client_id, message)
+    
+    def _build_message(self, update_data: bytes, is_delta: bool,
+                       record_stats: bool = True) -> Dict[str, Any]:
+        """
+        Compress an encoded update and wrap it in a 'state_update' message.
         
-        # Send via socketio
-        self.socketio.emit('state_update', {
+        Args:
+            update_data: Encoded payload from prepare_update
+            is_delta: Whether the payload is a delta update
+            record_stats: Whether to count the compression in the statistics;
+                False when running in the worker pool
+            
+        Returns:
+            Message dictionary
+        """
+        compressed_data, is_compressed = self.synchronizer.compress_data(update_data, record_stats)
+        
+        return {
             'data': compressed_data,
             'is_delta': is_delta,
             'is_compressed': is_compressed
-        }, room=client_id)
+        }
+    
+    def _flush_updates(self, batch: List[Tuple[str, Any]]) -> None:
+        """
+        Hand all updates collected during a tick to the client sender tasks.
+        
+        The updates are queued back to back after the tick's work is done, so
+        each sender picks up everything for its client in one wake-up and
+        coalesces it into a single frame.
+        
+        Args:
+            batch: List of (client_id, message or pending message future) pairs
+        """
+        # Pool results are shared by a session's clients; resolve and count
+        # each once, here on the loop thread
+        resolved = {}
+        for client_id, message in batch:
+            if isinstance(message, concurrent.futures.Future):
+                future = message
+                message = resolved.get(future)
+                if message is None:
+                    message = resolved[future] = future.result()
+                    if message['is_compressed']:
+                        self.synchronizer.stats['compressed_updates'] += 1
+            
+            # Skip clients whose session ended during the tick
+            if client_id not in self.active_sessions:
+                continue
+            self._enqueue_update(client_id, message)
     
     def _start_update_loop(self) -> None:
         """Start the background update loop."""
@@ -591,11 +1235,16 @@ class WebSocketStateManager:
         # Get current time for delta calculation
         current_time = time.time()
         
-        # Update all active modules
+        # Updates are encoded during the loop and emitted together afterwards
+        batch = []
+        
+        # Group clients by session so each module is updated once per cycle
+        sessions = {}
         for client_id, session in list(self.active_sessions.items()):
-            module = session['module']
-            session_id = session['session_id']
-            
+            sessions.setdefault(session['session_id'], (session['module'], []))[1].append(client_id)
+        
+        # Update all active modules
+        for session_id, (module, client_ids) in sessions.items():
             # Calculate time since last update
             dt = current_time - self.last_updates.get(session_id, current_time)
             
@@ -603,8 +1252,17 @@ class WebSocketStateManager:
             self.update_module_state(module, dt)
             self.last_updates[session_id] = current_time
             
-            # Send update to client
-            self.send_update(client_id)
+            # Read the state once and share identical payloads (e.g. keyframes
+            # for clients in step) between the session's clients
+            snapshot = self._get_state_snapshot(module)
+            shared = {}
+            
+            # Queue update for each client
+            for client_id in client_ids:
+                self.send_update(client_id, batch, current_time, snapshot, shared)
+        
+        # Queue all updates for this tick together so senders coalesce them
+        self._flush_updates(batch)
         
         # Schedule next update if we have any sessions
         if self.active_sessions:
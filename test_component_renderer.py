@@ -9,7 +9,6 @@ with various UI components and theme switching.
 import pygame
 import sys
 import os
-import time
 from pathlib import Path
 
 # Add the project root to the path
@@ -17,71 +16,32 @@ project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
 
 # Import from MetaMindIQTrain package
-from MetaMindIQTrain.core.theme import Theme, ThemeProvider, set_theme, create_dark_theme, create_light_theme
+from MetaMindIQTrain.core.theme import ThemeProvider, set_theme, create_dark_theme, create_light_theme
 from MetaMindIQTrain.clients.pygame.renderers.theme_component_renderer import ThemeComponentRenderer
-from MetaMindIQTrain.config import scale_coordinates, scale_for_resolution
 
-def main():
-    """Main function to run the test."""
-    # Initialize pygame
-    pygame.init()
-    
-    # Set up the display
-    screen_width = 1440
-    screen_height = 1024
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("Theme Component Renderer Test")
-    
-    # Set up clock for limiting FPS
-    clock = pygame.time.Clock()
-    fps = 60
-    
-    # Create themes
-    dark_theme = create_dark_theme()
-    light_theme = create_light_theme()
-    
-    # Set initial theme
-    current_theme = dark_theme
-    set_theme(current_theme)
-    
-    # Create renderer
-    renderer = ThemeComponentRenderer(screen)
+def build_static_background(renderer, current_theme, screen, screen_width):
+    """Render every element that does not animate onto a background surface.
     
-    # Main loop
-    running = True
-    last_theme_switch = time.time()
-    progress_value = 0.0
-    progress_direction = 0.01
+    Args:
+        renderer: ThemeComponentRenderer to draw with
+        current_theme: Theme the background is rendered for
+        screen: Display surface the background is sized and formatted for
+        screen_width: Width of the display in pixels
+        
+    Returns:
+        Surface holding the static UI for the theme
+    """
+    # Opaque and in display format so per-frame blits take SDL's copy path
+    static_bg = pygame.Surface(screen.get_size()).convert()
     
-    while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                elif event.key == pygame.K_t and time.time() - last_theme_switch > 0.5:
-                    # Toggle theme
-                    current_theme = light_theme if current_theme == dark_theme else dark_theme
-                    set_theme(current_theme)
-                    renderer.theme = current_theme
-                    renderer.theme_provider = ThemeProvider(current_theme)
-                    last_theme_switch = time.time()
-                    
-                    # Clear caches when theme changes
-                    renderer.component_render_cache.clear()
-                    renderer.cache_timestamps.clear()
-        
-        # Update progress bar demo
-        progress_value += progress_direction
-        if progress_value >= 1.0 or progress_value <= 0.0:
-            progress_direction *= -1
-        
-        # Clear screen
+    # Point the renderer at the background surface while drawing
+    target = renderer.screen
+    renderer.screen = static_bg
+    try:
+        # Clear background
         bg_color = current_theme.colors.get("background", (30, 30, 30))
-        screen.fill(bg_color)
-        
+        static_bg.fill(bg_color)
+    
         # Draw title
         title = f"Component Renderer Test - {current_theme.name}"
         renderer.render_text(
@@ -90,7 +50,7 @@ def main():
             variant="title",
             textAlign="center"
         )
-        
+    
         # Draw subtitle
         subtitle = "Press 'T' to toggle theme, 'Esc' to exit"
         renderer.render_text(
@@ -99,7 +59,7 @@ def main():
             variant="subtitle",
             textAlign="center"
         )
-        
+    
         # Draw containers section
         containers_title = "Containers"
         renderer.render_text(
@@ -108,21 +68,21 @@ def main():
             variant="subtitle",
             textAlign="center"
         )
-        
+    
         # Draw panel container
         renderer.render_rectangle(
             (100, 200),
             (screen_width // 2 - 150, 200),
             variant="panel"
         )
-        
+    
         # Draw card container
         renderer.render_rectangle(
             (100, 420),
             (screen_width // 2 - 150, 200),
             variant="card"
         )
-        
+    
         # Draw buttons section
         buttons_title = "Buttons"
         renderer.render_text(
@@ -131,7 +91,7 @@ def main():
             variant="subtitle",
             textAlign="center"
         )
-        
+    
         # Draw primary button
         renderer.render_button(
             "Primary Button",
@@ -139,7 +99,7 @@ def main():
             (200, 50),
             variant="primary"
         )
-        
+    
         # Draw secondary button
         renderer.render_button(
             "Secondary Button",
@@ -147,7 +107,7 @@ def main():
             (200, 50),
             variant="secondary"
         )
-        
+    
         # Draw outline button
         renderer.render_button(
             "Outline Button",
@@ -155,7 +115,7 @@ def main():
             (200, 50),
             variant="outline"
         )
-        
+    
         # Draw disabled button
         renderer.render_button(
             "Disabled Button",
@@ -164,7 +124,7 @@ def main():
             variant="primary",
             state="disabled"
         )
-        
+    
         # Draw hover button
         renderer.render_button(
             "Hover Button",
@@ -173,7 +133,7 @@ def main():
             variant="primary",
             state="hover"
         )
-        
+    
         # Draw active button
         renderer.render_button(
             "Active Button",
@@ -182,7 +142,7 @@ def main():
             variant="primary",
             state="active"
         )
-        
+    
         # Draw text section
         text_title = "Text Styles"
         renderer.render_text(
@@ -191,55 +151,55 @@ def main():
             variant="subtitle",
             textAlign="center"
         )
-        
+    
         # Draw regular text
         renderer.render_text(
             "Regular Text",
             (100, 700)
         )
-        
+    
         # Draw title text
         renderer.render_text(
             "Title Text",
             (100, 740),
             variant="title"
         )
-        
+    
         # Draw subtitle text
         renderer.render_text(
             "Subtitle Text",
             (100, 780),
             variant="subtitle"
         )
-        
+    
         # Draw caption text
         renderer.render_text(
             "Caption Text",
             (100, 820),
             variant="caption"
         )
-        
+    
         # Draw label text
         renderer.render_text(
             "Label Text",
             (100, 860),
             variant="label"
         )
-        
+    
         # Draw highlighted text
         renderer.render_text(
             "Highlighted Text",
             (100, 900),
             state="highlighted"
         )
-        
+    
         # Draw error text
         renderer.render_text(
             "Error Text",
             (100, 940),
             state="error"
         )
-        
+    
         # Draw progress bars section
         progress_title = "Progress Bars"
         renderer.render_text(
@@ -248,73 +208,156 @@ def main():
             variant="subtitle",
             textAlign="center"
         )
-        
-        # Draw default progress bar
-        renderer.render_progress(
-            (screen_width // 2 + 100, 700),
-            (300, 20),
-            progress_value
-        )
-        
-        # Draw success progress bar
-        renderer.render_progress(
-            (screen_width // 2 + 100, 740),
-            (300, 20),
-            progress_value,
-            variant="success"
-        )
-        
-        # Draw warning progress bar
-        renderer.render_progress(
-            (screen_width // 2 + 100, 780),
-            (300, 20),
-            progress_value,
-            variant="warning"
-        )
-        
-        # Draw error progress bar
-        renderer.render_progress(
-            (screen_width // 2 + 100, 820),
-            (300, 20),
-            progress_value,
-            variant="error"
-        )
-        
+    
         # Draw circles
         renderer.render_circle(
             (screen_width // 2 + 150, 880),
             20
         )
-        
+    
         renderer.render_circle(
             (screen_width // 2 + 210, 880),
             20,
             variant="indicator"
         )
-        
+    
         renderer.render_circle(
             (screen_width // 2 + 270, 880),
             20,
             state="active"
         )
-        
+    
         renderer.render_circle(
             (screen_width // 2 + 330, 880),
             20,
             state="success"
         )
-        
+    
         renderer.render_circle(
             (screen_width // 2 + 390, 880),
             20,
             state="error"
         )
-        
-        # Update display
-        pygame.display.flip()
-        
+    finally:
+        renderer.screen = target
+    
+    return static_bg
+
+def main():
+    """Main function to run the test."""
+    # Let SDL coalesce draw calls on backends that use its renderer
+    os.environ.setdefault('SDL_RENDER_BATCHING', '1')
+    
+    # Initialize pygame
+    pygame.init()
+    
+    # Only queue the events the loop handles
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+    
+    # Set up the display
+    screen_width = 1440
+    screen_height = 1024
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    pygame.display.set_caption("Theme Component Renderer Test")
+    
+    # Set up clock for limiting FPS
+    clock = pygame.time.Clock()
+    fps = 60
+    
+    # Create themes
+    dark_theme = create_dark_theme()
+    light_theme = create_light_theme()
+    
+    # Set initial theme
+    current_theme = dark_theme
+    set_theme(current_theme)
+    
+    # Create renderer
+    renderer = ThemeComponentRenderer(screen)
+    
+    # One provider and one component cache per theme, so toggling back and
+    # forth reuses surfaces rendered for the other theme
+    providers = {theme.name: ThemeProvider(theme) for theme in (dark_theme, light_theme)}
+    caches = {theme.name: ({}, {}) for theme in (dark_theme, light_theme)}
+    
+    def apply_theme(theme):
+        """Point the renderer at a theme and its provider and caches."""
+        set_theme(theme)
+        renderer.theme = theme
+        renderer.theme_provider = providers[theme.name]
+        renderer.component_render_cache, renderer.cache_timestamps = caches[theme.name]
+    
+    # Pre-render the static UI (all titles, text samples, containers, buttons
+    # and circles) for both themes up front so toggling never renders text
+    static_backgrounds = {}
+    for theme in (light_theme, dark_theme):
+        apply_theme(theme)
+        static_backgrounds[theme.name] = build_static_background(renderer, theme, screen, screen_width)
+    
+    # Initial theme was applied last
+    static_bg = static_backgrounds[current_theme.name]
+    
+    # Animated progress bars: (position, size, variant), laid out once
+    progress_x = screen_width // 2 + 100
+    progress_bars = [
+        ((progress_x, 700), (300, 20), None),
+        ((progress_x, 740), (300, 20), "success"),
+        ((progress_x, 780), (300, 20), "warning"),
+        ((progress_x, 820), (300, 20), "error"),
+    ]
+    
+    # Main loop
+    running = True
+    last_theme_switch = pygame.time.get_ticks()
+    
+    # Only the progress bars change between frames, so after a full redraw
+    # just their rects are restored from the background and presented
+    full_redraw = True
+    dirty_rects = []
+    
+    while running:
         # Limit FPS
         clock.tick(fps)
+        
+        # Handle events
+        for event in pygame.event.get([pygame.QUIT, pygame.KEYDOWN]):
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_t and pygame.time.get_ticks() - last_theme_switch >= 500:
+                    # Toggle theme
+                    current_theme = light_theme if current_theme == dark_theme else dark_theme
+                    apply_theme(current_theme)
+                    static_bg = static_backgrounds[current_theme.name]
+                    last_theme_switch = pygame.time.get_ticks()
+                    full_redraw = True
+        
+        # Update progress bar demo: a triangle wave over a 4 second period,
+        # derived from the tick count so it never drifts
+        progress_value = abs(((pygame.time.get_ticks() * 0.0005) % 2.0) - 1.0)
+        
+        # Static UI is pre-rendered once per theme
+        if full_redraw:
+            screen.blit(static_bg, (0, 0))
+        else:
+            for rect in dirty_rects:
+                screen.blit(static_bg, rect, rect)
+        
+        # Draw the default, success, warning and error progress bars
+        dirty_rects = renderer.render_progress_batch([
+            (position, size, progress_value, variant)
+            for position, size, variant in progress_bars
+        ])
+        
+        # Update display
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty_rects)
     
     # Clean up
     pygame.quit()
@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
 import sys
-import importlib as importlib_module
 import importlib.metadata
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+# Distribution names for packages whose import name differs
+DIST_NAMES = {
+    'PIL': 'Pillow',
+    'dotenv': 'python-dotenv',
+    'flask_cors': 'Flask-Cors',
+    'flask_socketio': 'Flask-SocketIO',
+    'pygame': 'pygame-ce',
+}
 
 def check_module(name):
-    try:
-        module = importlib_module.import_module(name)
-        version = getattr(module, '__version__', 'unknown')
-        if version == 'unknown':
-            try:
-                version = importlib.metadata.version(name.replace('._', '.').split('.')[0])
-            except:
-                pass
-        print(f"✅ {name}: {version}")
-        return True
-    except ImportError:
-        print(f"❌ {name}: Not installed")
-        return False
+    """Return (installed, report line) for a module; safe to run in a worker."""
+    # Resolve the module spec without executing the module
+    if importlib.util.find_spec(name) is None:
+        return False, f"❌ {name}: Not installed"
+    
+    # Mapped distribution first, then one named after the package itself
+    # (e.g. classic pygame rather than pygame-ce)
+    top_level = name.split('.')[0]
+    version = 'unknown'
+    for dist_name in (DIST_NAMES.get(name, top_level), top_level):
+        try:
+            version = importlib.metadata.version(dist_name)
+            break
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return True, f"✅ {name}: {version}"
 
 print(f"Python version: {sys.version}")
 print(f"Virtual environment: {sys.prefix}")
@@ -34,7 +47,14 @@ modules = [
     'pathlib'
 ]
 
-all_passed = all(check_module(module) for module in modules)
+# Probe concurrently, then print in list order so output never interleaves
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = list(executor.map(check_module, modules))
+
+for _, line in results:
+    print(line)
+
+all_passed = all(installed for installed, _ in results)
 
 if all_passed:
     print("\n✅ All required packages are installed")
@@ -8,9 +8,10 @@ It ensures that each module can be properly initialized and rendered with the ge
 
 import sys
 import os
-import time
 import pygame
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -22,6 +23,11 @@ from MetaMindIQTrain.module_registry import create_module_instance, get_availabl
 from MetaMindIQTrain.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEFAULT_FPS
 from MetaMindIQTrain.clients.pygame.renderers.enhanced_generic_renderer import EnhancedGenericRenderer
 
+@lru_cache(maxsize=64)
+def _sysfont(name, size, bold=False):
+    """Load a system font, reusing fonts that were already looked up."""
+    return pygame.font.SysFont(name, size, bold=bold)
+
 def main():
     """Test all available modules with the enhanced generic renderer."""
     # Parse command-line arguments
@@ -30,9 +36,16 @@ def main():
     parser.add_argument("--duration", type=int, default=5, help="Duration to display each module (seconds)")
     args = parser.parse_args()
     
+    # Let SDL coalesce draw calls on backends that use its renderer
+    os.environ.setdefault('SDL_RENDER_BATCHING', '1')
+    
     # Initialize PyGame
     pygame.init()
     
+    # Only queue the events the loop handles
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT])
+    
     # Set up display
     if args.headless:
         os.environ['SDL_VIDEODRIVER'] = 'dummy'
@@ -47,10 +60,10 @@ def main():
     
     # Create fonts
     fonts = {
-        'small': pygame.font.SysFont("Arial", 18),
-        'medium': pygame.font.SysFont("Arial", 24),
-        'large': pygame.font.SysFont("Arial", 36),
-        'title': pygame.font.SysFont("Arial", 48, bold=True)
+        'small': _sysfont("Arial", 18),
+        'medium': _sysfont("Arial", 24),
+        'large': _sysfont("Arial", 36),
+        'title': _sysfont("Arial", 48, bold=True)
     }
     
     # Get all available modules
@@ -59,10 +72,18 @@ def main():
     for module_info in available_modules:
         print(f" - {module_info['name']} ({module_info['id']})")
     
+    # Create all module instances up front, overlapping their imports
+    module_ids = [module_info['id'] for module_info in available_modules]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        instances = dict(zip(module_ids, executor.map(create_module_instance, module_ids)))
+    
     # Create a clock for framerate control
     clock = pygame.time.Clock()
     fps = DEFAULT_FPS
     
+    # One renderer is shared by all modules so fonts and layout stay resident
+    renderer = EnhancedGenericRenderer(screen, module_ids[0], fonts=fonts) if module_ids else None
+    
     # Test each module
     for module_info in available_modules:
         module_id = module_info['id']
@@ -70,12 +91,12 @@ def main():
         
         # Create the module instance
         try:
-            module = create_module_instance(module_id)
+            module = instances[module_id]
             print(f"\nTesting module: {module_name} (ID: {module_id})")
             
-            # Create renderer for this specific module
-            renderer = EnhancedGenericRenderer(screen, module_id, fonts=fonts)
-            print(f" - Created enhanced generic renderer for {module_name}")
+            # Point the shared renderer at this module
+            renderer.set_module(module_id)
+            print(f" - Switched enhanced generic renderer to {module_name}")
             
             # Start a challenge if supported
             if hasattr(module, 'start_challenge'):
@@ -89,12 +110,18 @@ def main():
             # Set window title
             pygame.display.set_caption(f"Testing {module_name}")
             
+            # Test information text; the countdown is re-rendered only when it changes
+            info_surf = fonts['small'].render(f"Testing {module_name} ({module_id})", True, (255, 255, 255))
+            prev_time_left = -1
+            time_surf = None
+            
             # Display for specified duration
-            start_time = time.time()
+            end_tick = pygame.time.get_ticks() + args.duration * 1000
+            last_update_ms = pygame.time.get_ticks()
             
-            while time.time() - start_time < args.duration:
+            while pygame.time.get_ticks() < end_tick:
                 # Process events
-                for event in pygame.event.get():
+                for event in pygame.event.get([pygame.QUIT]):
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
@@ -106,12 +133,13 @@ def main():
                 renderer.render(state)
                 
                 # Draw test information
-                info_text = fonts['small'].render(f"Testing {module_name} ({module_id})", True, (255, 255, 255))
-                screen.blit(info_text, (10, 10))
+                screen.blit(info_surf, (10, 10))
                 
-                time_left = int(args.duration - (time.time() - start_time))
-                time_text = fonts['small'].render(f"Time remaining: {time_left}s", True, (255, 255, 255))
-                screen.blit(time_text, (10, 30))
+                time_left = max(0, (end_tick - pygame.time.get_ticks()) // 1000)
+                if time_left != prev_time_left:
+                    time_surf = fonts['small'].render(f"Time remaining: {time_left}s", True, (255, 255, 255))
+                    prev_time_left = time_left
+                screen.blit(time_surf, (10, 30))
                 
                 # Update display
                 pygame.display.flip()
@@ -119,10 +147,13 @@ def main():
                 # Cap the frame rate
                 clock.tick(fps)
                 
-                # Get updated state periodically
-                if hasattr(module, 'update') and callable(getattr(module, 'update')):
+                # Get updated state periodically (~10 Hz); the renderer keeps
+                # drawing the previous state in between
+                now = pygame.time.get_ticks()
+                if now - last_update_ms >= 100 and callable(getattr(module, 'update', None)):
                     module.update()
                     state = module.get_state()
+                    last_update_ms = now
             
             print(f" - Successfully displayed {module_name} for {args.duration} seconds")
             
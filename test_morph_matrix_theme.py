@@ -9,9 +9,12 @@ that doesn't depend on the full package structure.
 
 import pygame
 import sys
-import time
 import logging
 import random
+import heapq
+import itertools
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 # Add the project root to Python path if needed
@@ -24,6 +27,82 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=32)
+def _get_font(size):
+    """Load the Arial system font at a size, shared across test harnesses."""
+    return pygame.font.SysFont("Arial", size)
+
+# Palette slots, in the order of SimpleTheme._palette
+class C:
+    """Indices into a theme's palette tuple."""
+    BACKGROUND = 0
+    CARD = 1
+    SURFACE = 2
+    BORDER = 3
+    TEXT = 4
+    TEXT_SECONDARY = 5
+    TEXT_DISABLED = 6
+    PRIMARY = 7
+    PRIMARY_HOVER = 8
+    PRIMARY_ACTIVE = 9
+    SECONDARY = 10
+    ACCENT = 11
+    SUCCESS = 12
+    ERROR = 13
+    WARNING = 14
+    INFO = 15
+
+COLOR_NAMES = (
+    "background",
+    "card",
+    "surface",
+    "border",
+    "text",
+    "text_secondary",
+    "text_disabled",
+    "primary",
+    "primary_hover",
+    "primary_active",
+    "secondary",
+    "accent",
+    "success",
+    "error",
+    "warning",
+    "info",
+)
+
+# (subtype, state) pairs of the morph_matrix styles precomputed per theme
+DEFAULT_STYLE_KEYS = (
+    ("container", ""),
+    ("title", ""),
+    ("instruction", ""),
+    ("matrix", ""),
+    ("cell", "filled"),
+    ("cell", "empty"),
+    ("option", ""),
+    ("option", "correct"),
+    ("option", "incorrect"),
+    ("option", "selected"),
+    ("option", "missed"),
+    ("option_label", ""),
+    ("score", ""),
+    ("feedback", "correct"),
+    ("feedback", "incorrect"),
+    ("feedback", "partial"),
+)
+
+class _StyleTable(dict):
+    """Style dictionary that generates default styles for missing keys."""
+    
+    __slots__ = ("_theme",)
+    
+    def __init__(self, theme):
+        super().__init__()
+        self._theme = theme
+    
+    def __missing__(self, key):
+        return self._theme._generate_default_style(key)
+
 # Simple Theme implementation for testing
 class SimpleTheme:
     """Simple theme implementation for testing."""
@@ -38,7 +117,18 @@ class SimpleTheme:
         self.name = name
         self.id = id
         self.colors = {}
-        self._styles = {}
+        self._styles = _StyleTable(self)
+    
+    @property
+    def colors(self):
+        """Color dictionary; assign a new dict to change the palette."""
+        return self._colors
+    
+    @colors.setter
+    def colors(self, colors):
+        self._colors = colors
+        # Immutable palette indexed by C, used when generating styles
+        self._palette = tuple(colors.get(name, (255, 255, 255)) for name in COLOR_NAMES)
     
     def get_color(self, key):
         """Get a color from the theme.
@@ -93,11 +183,21 @@ class SimpleTheme:
         Returns:
             Style dictionary
         """
-        if key in self._styles:
-            return self._styles[key]
+        # Unknown keys fall through to a default style based on component type
+        return self._styles[key]
+    
+    def precompute_styles(self):
+        """Build the default style table up front.
+        
+        Call after colors and border radii are assigned. Once the table is
+        built, get_style is rebound to the table's own lookup, so render-time
+        calls never enter Python code for known keys.
+        """
+        for subtype, state in DEFAULT_STYLE_KEYS:
+            key = f"morph_matrix.{subtype}.{state}" if state else f"morph_matrix.{subtype}"
+            self._generate_default_style(key)
         
-        # Default style based on component type
-        return self._generate_default_style(key)
+        self.get_style = self._styles.__getitem__
     
     def _generate_default_style(self, key):
         """Generate a default style based on the component type.
@@ -113,111 +213,112 @@ class SimpleTheme:
         subtype = parts[1] if len(parts) > 1 else ""
         state = parts[2] if len(parts) > 2 else ""
         
+        palette = self._palette
         style = {}
         
         # Basic styling based on component type
         if component == "morph_matrix":
             if subtype == "container":
                 style = {
-                    "backgroundColor": self.get_color("card"),
+                    "backgroundColor": palette[C.CARD],
                     "borderWidth": 2,
-                    "borderColor": self.get_color("border"),
+                    "borderColor": palette[C.BORDER],
                     "borderRadius": self.get_border_radius("large")
                 }
             elif subtype == "title":
                 style = {
-                    "color": self.get_color("text"),
+                    "color": palette[C.TEXT],
                     "fontSize": 32
                 }
             elif subtype == "instruction":
                 style = {
-                    "color": self.get_color("text_secondary"),
+                    "color": palette[C.TEXT_SECONDARY],
                     "fontSize": 20
                 }
             elif subtype == "matrix":
                 style = {
-                    "backgroundColor": self.get_color("surface"),
+                    "backgroundColor": palette[C.SURFACE],
                     "borderWidth": 2,
-                    "borderColor": self.get_color("primary"),
+                    "borderColor": palette[C.PRIMARY],
                     "borderRadius": self.get_border_radius("medium")
                 }
             elif subtype == "cell":
                 if state == "filled":
                     style = {
-                        "backgroundColor": self.get_color("primary"),
+                        "backgroundColor": palette[C.PRIMARY],
                         "borderWidth": 1,
-                        "borderColor": self.get_color("primary_hover"),
+                        "borderColor": palette[C.PRIMARY_HOVER],
                         "borderRadius": self.get_border_radius("small")
                     }
                 else:  # empty
                     style = {
-                        "backgroundColor": self.get_color("surface"),
+                        "backgroundColor": palette[C.SURFACE],
                         "borderWidth": 1,
-                        "borderColor": self.get_color("border"),
+                        "borderColor": palette[C.BORDER],
                         "borderRadius": self.get_border_radius("small")
                     }
             elif subtype == "option":
                 if state == "correct":
                     style = {
-                        "backgroundColor": self.get_color("surface"),
+                        "backgroundColor": palette[C.SURFACE],
                         "borderWidth": 2,
-                        "borderColor": self.get_color("success"),
+                        "borderColor": palette[C.SUCCESS],
                         "borderRadius": self.get_border_radius("small")
                     }
                 elif state == "incorrect":
                     style = {
-                        "backgroundColor": self.get_color("surface"),
+                        "backgroundColor": palette[C.SURFACE],
                         "borderWidth": 2,
-                        "borderColor": self.get_color("error"),
+                        "borderColor": palette[C.ERROR],
                         "borderRadius": self.get_border_radius("small")
                     }
                 elif state == "selected":
                     style = {
-                        "backgroundColor": self.get_color("surface"),
+                        "backgroundColor": palette[C.SURFACE],
                         "borderWidth": 2,
-                        "borderColor": self.get_color("primary"),
+                        "borderColor": palette[C.PRIMARY],
                         "borderRadius": self.get_border_radius("small")
                     }
                 elif state == "missed":
                     style = {
-                        "backgroundColor": self.get_color("surface"),
+                        "backgroundColor": palette[C.SURFACE],
                         "borderWidth": 2,
-                        "borderColor": self.get_color("warning"),
+                        "borderColor": palette[C.WARNING],
                         "borderRadius": self.get_border_radius("small")
                     }
                 else:
                     style = {
-                        "backgroundColor": self.get_color("surface"),
+                        "backgroundColor": palette[C.SURFACE],
                         "borderWidth": 2,
-                        "borderColor": self.get_color("border"),
+                        "borderColor": palette[C.BORDER],
                         "borderRadius": self.get_border_radius("small")
                     }
             elif subtype == "option_label":
                 style = {
-                    "color": self.get_color("text"),
+                    "color": palette[C.TEXT],
                     "fontSize": 16
                 }
             elif subtype == "score":
                 style = {
-                    "color": self.get_color("text_secondary"),
+                    "color": palette[C.TEXT_SECONDARY],
                     "fontSize": 18
                 }
             elif subtype == "feedback":
                 if state == "correct":
                     style = {
-                        "color": self.get_color("success"),
+                        "color": palette[C.SUCCESS],
                         "fontSize": 28,
                         "fontWeight": "bold"
                     }
                 elif state == "incorrect":
                     style = {
-                        "color": self.get_color("error"),
+                        "color": palette[C.ERROR],
                         "fontSize": 28,
                         "fontWeight": "bold"
                     }
                 elif state == "partial":
                     style = {
-                        "color": self.get_color("warning"),
+                        "color": palette[C.WARNING],
                         "fontSize": 28,
                         "fontWeight": "bold"
                     }
@@ -264,10 +365,6 @@ class MorphMatrixTest:
         # Initialize themes
         self.init_themes()
         
-        # Time tracking
-        self.prev_time = time.time()
-        self.current_time = time.time()
-        
         # Initialize the module with theme provider
         self.morph_matrix = ThemeAwareMorphMatrix(
             difficulty=1,
@@ -275,8 +372,27 @@ class MorphMatrixTest:
             resolution=(self.width, self.height)
         )
         
-        # Scheduled events
+        # Scheduled events, a heap of (due_ticks, sequence, callback)
         self.scheduled_events = []
+        self._event_counter = itertools.count()
+        
+        # Rendered text surfaces keyed by (text, font_size, color), LRU-bounded
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 256
+        
+        # Pre-rendered rounded rectangles keyed by (w, h, bg, border, border_width, radius)
+        self._rect_cache = {}
+        
+        # Component renderers by component type
+        self._renderers = {
+            "rectangle": self._render_rect,
+            "text": self._render_text,
+            "circle": self._render_circle,
+        }
+        
+        # Theme-dependent colors and banner surfaces used every frame
+        self._last_ui_signature = None
+        self._refresh_theme_cache()
     
     def init_pygame(self):
         """Initialize pygame and create the display."""
@@ -290,15 +406,10 @@ class MorphMatrixTest:
         # Create the window
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("MetaMindIQTrain - Theme-Aware Morph Matrix")
-        
-        # Create font cache
-        self.fonts = {}
     
     def get_font(self, size):
         """Get a font of the specified size."""
-        if size not in self.fonts:
-            self.fonts[size] = pygame.font.SysFont("Arial", size)
-        return self.fonts[size]
+        return _get_font(size)
     
     def init_themes(self):
         """Initialize themes for testing."""
@@ -443,6 +554,14 @@ class MorphMatrixTest:
             "large": 0,
         }
         
+        # Build each theme's style table once
+        for theme in (self.dark_theme, self.light_theme, self.high_contrast_theme):
+            theme.precompute_styles()
+        
+        # Pre-load the font sizes the themes and styles use
+        for size in (14, 16, 18, 20, 24, 28, 32, 36):
+            _get_font(size)
+        
         # Create theme provider with dark theme as default
         self.theme_provider = SimpleThemeProvider(self.dark_theme)
     
@@ -460,6 +579,37 @@ class MorphMatrixTest:
         
         # Update module theme
         self.morph_matrix.set_theme(self.theme_provider)
+        
+        # Re-resolve frame colors and banners for the new theme
+        self._refresh_theme_cache()
+        
+        # Drop surfaces and style tuples from the previous theme
+        self._text_cache.clear()
+        self._rect_cache.clear()
+        if self.morph_matrix.ui:
+            for component in self.morph_matrix.ui.components:
+                component._rstyle = None
+    
+    def _refresh_theme_cache(self):
+        """Resolve the current theme's frame colors and pre-render the banners."""
+        self._needs_redraw = True
+        
+        colors = self.theme_provider.theme.colors
+        self._bg_color = colors["background"]
+        self._text_color = colors["text"]
+        self._text2_color = colors["text_secondary"]
+        
+        font = self.get_font(20)
+        
+        # Theme info text at top
+        theme_text = f"Current Theme: {self.theme_provider.theme.name} (Press T to toggle themes)"
+        self._banner_surface = font.render(theme_text, True, self._text_color).convert_alpha()
+        self._banner_rect = self._banner_surface.get_rect(center=(self.width // 2, 30))
+        
+        # Controls text at bottom
+        controls_text = "Controls: Space = Submit, R = Reset, ESC = Exit"
+        self._controls_surface = font.render(controls_text, True, self._text2_color).convert_alpha()
+        self._controls_rect = self._controls_surface.get_rect(center=(self.width // 2, self.height - 30))
     
     def schedule_event(self, callback, delay):
         """Schedule an event to be executed after a delay.
@@ -468,10 +618,10 @@ class MorphMatrixTest:
             callback: Function to call
             delay: Delay in seconds
         """
-        self.scheduled_events.append({
-            "callback": callback,
-            "time": time.time() + delay
-        })
+        heapq.heappush(
+            self.scheduled_events,
+            (pygame.time.get_ticks() + int(delay * 1000), next(self._event_counter), callback)
+        )
     
     def handle_events(self):
         """Handle pygame events."""
@@ -512,99 +662,182 @@ class MorphMatrixTest:
         # Update module
         self.morph_matrix.update(delta_time)
         
-        # Check scheduled events
-        current_time = time.time()
-        current_events = self.scheduled_events.copy()
-        self.scheduled_events = []
+        # Run scheduled events that are due, earliest first
+        current_time = pygame.time.get_ticks()
+        events = self.scheduled_events
+        while events and events[0][0] <= current_time:
+            _, _, callback = heapq.heappop(events)
+            callback()
+    
+    def _resolve_style(self, component):
+        """Get a component's style properties as a tuple, cached on the component.
         
-        for event in current_events:
-            if current_time >= event["time"]:
-                event["callback"]()
-            else:
-                self.scheduled_events.append(event)
+        The cache is keyed on a snapshot of the style's items, so the tuple is
+        rebuilt when the style is replaced or mutated in place, or after
+        toggle_theme clears it.
+        
+        Returns:
+            (bg_color, border_width, border_color, border_radius, color, font_size)
+        """
+        style = component.style
+        snapshot = tuple(style.items())
+        cached = component.__dict__.get("_rstyle")
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+        
+        resolved = (
+            style.get("backgroundColor", (100, 100, 100)),
+            style.get("borderWidth", 0),
+            style.get("borderColor", (0, 0, 0)),
+            style.get("borderRadius", 0),
+            style.get("color", (255, 255, 255)),
+            style.get("fontSize", 20),
+        )
+        component._rstyle = (snapshot, resolved)
+        return resolved
+    
+    def _render_rounded_rect(self, width, height, bg_color, border_color, border_width, border_radius):
+        """Render a rounded rectangle with optional border onto its own surface."""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        rect = surface.get_rect()
+        
+        # Draw filled rectangle with rounded corners
+        pygame.draw.rect(surface, bg_color, rect, 0, border_radius)
+        if border_width > 0:
+            # Draw border
+            pygame.draw.rect(surface, border_color, rect, border_width, border_radius)
+        
+        return surface
+    
+    def _render_rect(self, component):
+        """Render a rectangle component."""
+        # Get style properties
+        bg_color, border_width, border_color, border_radius, _, _ = self._resolve_style(component)
+        
+        # Reuse the component's rect until its position or size changes
+        x, y = component.position
+        width = component.width
+        height = component.height
+        rect = component.__dict__.get("_rect")
+        if rect is None or rect.x != x or rect.y != y or rect.width != width or rect.height != height:
+            rect = component._rect = pygame.Rect(x, y, width, height)
+        
+        screen = self.screen
+        
+        # Draw with border radius if supported
+        if border_radius > 0:
+            # Blit the pre-rendered rounded rectangle for this shape
+            rect_cache = self._rect_cache
+            key = (rect.width, rect.height, bg_color, border_color, border_width, border_radius)
+            surface = rect_cache.get(key)
+            if surface is None:
+                surface = self._render_rounded_rect(*key)
+                rect_cache[key] = surface
+            screen.blit(surface, rect)
+        else:
+            # Draw regular rectangle
+            draw_rect = pygame.draw.rect
+            draw_rect(screen, bg_color, rect)
+            if border_width > 0:
+                # Draw border
+                draw_rect(screen, border_color, rect, border_width)
+    
+    def _render_text(self, component):
+        """Render a text component."""
+        # Get style properties
+        _, _, _, _, color, font_size = self._resolve_style(component)
+        
+        # Render text, reusing the surface for unchanged strings
+        text = component.text
+        text_cache = self._text_cache
+        key = (text, font_size, color)
+        text_surface = text_cache.get(key)
+        if text_surface is None:
+            # Convert once to the display format so cached blits skip conversion
+            text_surface = self.get_font(font_size).render(text, True, color).convert_alpha()
+            text_cache[key] = text_surface
+            if len(text_cache) > self._text_cache_size:
+                text_cache.popitem(last=False)
+        else:
+            text_cache.move_to_end(key)
+        
+        # Adjust position based on alignment
+        x, y = component.position
+        align = component.align
+        if align == "center":
+            x -= text_surface.get_width() // 2
+        elif align == "right":
+            x -= text_surface.get_width()
+        
+        # Draw text
+        self.screen.blit(text_surface, (x, y))
+    
+    def _render_circle(self, component):
+        """Render a circle component."""
+        # Get style properties
+        bg_color, border_width, border_color, _, _, _ = self._resolve_style(component)
+        
+        screen = self.screen
+        draw_circle = pygame.draw.circle
+        position = component.position
+        radius = component.radius
+        
+        # Draw filled circle
+        draw_circle(screen, bg_color, position, radius)
+        
+        # Draw border if needed
+        if border_width > 0:
+            draw_circle(screen, border_color, position, radius, border_width)
     
     def render_components(self, components):
         """Render UI components to the screen."""
+        renderers = self._renderers
         for component in components:
-            if component.type == "rectangle":
-                # Get style properties
-                bg_color = component.style.get("backgroundColor", (100, 100, 100))
-                border_width = component.style.get("borderWidth", 0)
-                border_color = component.style.get("borderColor", (0, 0, 0))
-                border_radius = component.style.get("borderRadius", 0)
-                
-                rect = pygame.Rect(component.position[0], component.position[1], 
-                                  component.width, component.height)
-                
-                # Draw with border radius if supported
-                if border_radius > 0:
-                    # Draw filled rectangle with rounded corners
-                    pygame.draw.rect(self.screen, bg_color, rect, 0, border_radius)
-                    if border_width > 0:
-                        # Draw border
-                        pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius)
-                else:
-                    # Draw regular rectangle
-                    pygame.draw.rect(self.screen, bg_color, rect)
-                    if border_width > 0:
-                        # Draw border
-                        pygame.draw.rect(self.screen, border_color, rect, border_width)
-            
-            elif component.type == "text":
-                # Get style properties
-                color = component.style.get("color", (255, 255, 255))
-                font_size = component.style.get("fontSize", 20)
-                
-                # Render text
-                font = self.get_font(font_size)
-                text_surface = font.render(component.text, True, color)
-                
-                # Adjust position based on alignment
-                x, y = component.position
-                if component.align == "center":
-                    x -= text_surface.get_width() // 2
-                elif component.align == "right":
-                    x -= text_surface.get_width()
-                
-                # Draw text
-                self.screen.blit(text_surface, (x, y))
-            
-            elif component.type == "circle":
-                # Get style properties
-                bg_color = component.style.get("backgroundColor", (100, 100, 100))
-                border_width = component.style.get("borderWidth", 0)
-                border_color = component.style.get("borderColor", (0, 0, 0))
-                
-                # Draw filled circle
-                pygame.draw.circle(self.screen, bg_color, component.position, component.radius)
-                
-                # Draw border if needed
-                if border_width > 0:
-                    pygame.draw.circle(self.screen, border_color, component.position, component.radius, border_width)
+            renderer = renderers.get(component.type)
+            if renderer is not None:
+                renderer(component)
+    
+    def _ui_signature(self, components):
+        """Snapshot what render_components would draw, for change detection."""
+        return [
+            (
+                component.type,
+                tuple(component.position),
+                getattr(component, "width", None),
+                getattr(component, "height", None),
+                getattr(component, "radius", None),
+                getattr(component, "text", None),
+                # Copy the values: a style mutated in place must not change
+                # the stored signature along with it
+                tuple(component.style.items()),
+            )
+            for component in components
+        ]
     
     def render(self):
         """Render the current state to the screen."""
-        # Clear screen with background color
-        self.screen.fill(self.theme_provider.theme.colors["background"])
+        ui = self.morph_matrix.ui
+        components = ui.components if ui else ()
         
-        # Render module UI
-        if self.morph_matrix.ui:
-            self.render_components(self.morph_matrix.ui.components)
+        # Skip the frame entirely when neither the theme nor the UI changed
+        signature = self._ui_signature(components)
+        if not self._needs_redraw and signature == self._last_ui_signature:
+            return
+        self._last_ui_signature = signature
+        self._needs_redraw = False
         
-        # Add theme info text at top
-        theme_name = self.theme_provider.theme.name
-        theme_text = f"Current Theme: {theme_name} (Press T to toggle themes)"
+        screen = self.screen
         
-        font = self.get_font(20)
-        text_surface = font.render(theme_text, True, self.theme_provider.theme.colors["text"])
-        text_rect = text_surface.get_rect(center=(self.width // 2, 30))
-        self.screen.blit(text_surface, text_rect)
+        # Clear screen with background color
+        screen.fill(self._bg_color)
         
-        # Add controls text at bottom
-        controls_text = "Controls: Space = Submit, R = Reset, ESC = Exit"
-        controls_surface = font.render(controls_text, True, self.theme_provider.theme.colors["text_secondary"])
-        controls_rect = controls_surface.get_rect(center=(self.width // 2, self.height - 30))
-        self.screen.blit(controls_surface, controls_rect)
+        # Render module UI
+        if components:
+            self.render_components(components)
+        
+        # Add theme info text at top and controls text at bottom
+        screen.blit(self._banner_surface, self._banner_rect)
+        screen.blit(self._controls_surface, self._controls_rect)
         
         # Update display
         pygame.display.flip()
@@ -615,10 +848,8 @@ class MorphMatrixTest:
         clock = pygame.time.Clock()
         
         while running:
-            # Calculate delta time
-            self.current_time = time.time()
-            delta_time = self.current_time - self.prev_time
-            self.prev_time = self.current_time
+            # Cap at 60 FPS; the tick returns the elapsed milliseconds
+            delta_time = clock.tick(60) * 0.001
             
             # Handle events
             running = self.handle_events()
@@ -628,9 +859,6 @@ class MorphMatrixTest:
             
             # Render
             self.render()
-            
-            # Cap at 60 FPS
-            clock.tick(60)
         
         # Clean up
         pygame.quit()
@@ -7,7 +7,9 @@ including the unified audio engine and specialized module loader.
 """
 
 import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configure logging
@@ -20,30 +22,70 @@ project_dir = Path(__file__).resolve().parent
 if str(project_dir) not in sys.path:
     sys.path.insert(0, str(project_dir))
 
+# Resolve everything the tests use once; a failed import leaves the name None
+try:
+    from MetaMindIQTrain.core.audio.engine import get_audio_engine
+except ImportError as e:
+    logger.warning(f"Audio engine unavailable: {e}")
+    get_audio_engine = None
+
+try:
+    from MetaMindIQTrain.server.optimized.music_module_loader import get_music_module_loader
+except ImportError as e:
+    logger.warning(f"Music module loader unavailable: {e}")
+    get_music_module_loader = None
+
+try:
+    from MetaMindIQTrain.modules.music.music_theory_simplified import MusicTheorySimplifiedModule
+except ImportError as e:
+    logger.warning(f"Music theory module unavailable: {e}")
+    MusicTheorySimplifiedModule = None
+
+try:
+    from MetaMindIQTrain.module_registry import get_available_modules, create_module_instance
+except ImportError as e:
+    logger.warning(f"Module registry unavailable: {e}")
+    get_available_modules = create_module_instance = None
+
+def _wait_for_playback(started, duration):
+    """Sleep only for whatever is left of a sound started at `started`.
+    
+    The engines play asynchronously and have no completion callback, so
+    this waits out the remaining play time rather than a fixed padding.
+    
+    Args:
+        started: time.monotonic() reading taken when playback began
+        duration: Length of the sound in seconds
+    """
+    time.sleep(max(0.0, duration - (time.monotonic() - started)))
+
 def test_audio_engine():
     """Test the unified audio engine."""
+    if get_audio_engine is None:
+        logger.error("Error testing audio engine: engine could not be imported")
+        return False
+    
     try:
-        from MetaMindIQTrain.core.audio.engine import get_audio_engine
-        
         # Get the audio engine
         engine = get_audio_engine()
         logger.info(f"Audio engine initialized using {engine.get_backend_name()}")
         
         # Play a test note
         logger.info("Playing a test note (C4)...")
+        started = time.monotonic()
         engine.play_note(frequency=261.63, duration=1.0)  # C4
         
         # Wait for the note to finish
-        import time
-        time.sleep(1.5)
+        _wait_for_playback(started, 1.0)
         
         # Play a chord
         logger.info("Playing a C major chord...")
+        started = time.monotonic()
         engine.play_chord(
             frequencies=[261.63, 329.63, 392.00],  # C4, E4, G4
             duration=1.5
         )
-        time.sleep(2.0)
+        _wait_for_playback(started, 1.5)
         
         return True
     except Exception as e:
@@ -52,10 +94,11 @@ def test_audio_engine():
 
 def test_music_module_loader():
     """Test the specialized music module loader."""
+    if get_music_module_loader is None:
+        logger.error("Error testing music module loader: loader could not be imported")
+        return False
+    
     try:
-        # Import the music module loader
-        from MetaMindIQTrain.server.optimized.music_module_loader import get_music_module_loader
-        
         # Get the loader
         loader = get_music_module_loader()
         logger.info("Music module loader initialized")
@@ -73,21 +116,23 @@ def test_music_module_loader():
 
 def test_music_theory_module():
     """Test the simplified music theory module."""
+    if MusicTheorySimplifiedModule is None:
+        logger.error("Error testing music theory module: module could not be imported")
+        return False
+    
     try:
-        # Import the module directly
-        from MetaMindIQTrain.modules.music.music_theory_simplified import MusicTheorySimplifiedModule
-        
         # Create an instance
         module = MusicTheorySimplifiedModule()
         logger.info(f"Created music theory module: {module.name}")
         
         # Play a scale
         logger.info("Playing a C major scale...")
+        started = time.monotonic()
         module.play_scale("C4", "Major")
         
-        # Wait for the scale to finish
-        import time
-        time.sleep(3.0)
+        # Wait for the scale to finish: eight 0.4s notes started 0.36s apart.
+        # play_scale blocks for 8 * 0.36s, so this only waits out the tail.
+        _wait_for_playback(started, 7 * 0.36 + 0.4)
         
         # Generate a new challenge
         logger.info("Generating a new challenge...")
@@ -103,12 +148,12 @@ def test_music_theory_module():
 
 def test_integration():
     """Test integration with the module registry."""
+    if get_available_modules is None or get_music_module_loader is None:
+        logger.error("Error testing integration: registry or loader could not be imported")
+        return False
+    
     try:
-        # Import the module registry
-        from MetaMindIQTrain.module_registry import get_available_modules, create_module_instance
-        
         # Register the music module loader with the registry
-        from MetaMindIQTrain.server.optimized.music_module_loader import get_music_module_loader
         loader = get_music_module_loader()
         loader.initialize_for_server()
         
@@ -133,15 +178,22 @@ def test_integration():
         logger.error(f"Error testing integration: {e}")
         return False
 
+def _run_in_order(*tests):
+    """Run tests one after another and return their results."""
+    return [test() for test in tests]
+
 def main():
     """Run all tests."""
     logger.info("=== Testing Optimized Music Module System ===")
     
-    # Run tests
-    audio_test = test_audio_engine()
-    loader_test = test_music_module_loader()
-    module_test = test_music_theory_module()
-    integration_test = test_integration()
+    # Run tests. The tests that play audio share the output device, so they
+    # run back to back on one worker while the loader and registry tests
+    # run on the other.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        audio_future = executor.submit(_run_in_order, test_audio_engine, test_music_theory_module)
+        registry_future = executor.submit(_run_in_order, test_music_module_loader, test_integration)
+        audio_test, module_test = audio_future.result()
+        loader_test, integration_test = registry_future.result()
     
     # Print results
     logger.info("\n=== Test Results ===")
@@ -9,6 +9,7 @@ including the unified audio engine, renderer optimizations, and component system
 import sys
 import logging
 import time
+import argparse
 from pathlib import Path
 
 # Setup logging
@@ -43,11 +44,11 @@ def test_renderer():
         # Test rendering operations
         renderer.clear((0, 0, 0, 255))
         
-        # Queue several render operations
-        for i in range(5):
-            x = 100 + i * 120
-            y = 100
-            renderer.queue_render("rectangle", x, y, 100, 100, (255, 0, 0, 255))
+        # Queue several rectangles in one batch
+        renderer.queue_rectangles(
+            [(100 + i * 120, 100, 100, 100) for i in range(5)],
+            (255, 0, 0, 255)
+        )
             
         # Flush queue
         renderer.flush_queue()
@@ -68,7 +69,7 @@ def test_renderer():
         
         # Get render stats
         stats = renderer.get_stats()
-        logger.info(f"Render stats: {stats}")
+        logger.info("Render stats: %s", stats)
         
         # Short delay to see the result
         time.sleep(0.5)
@@ -96,23 +97,19 @@ def test_audio_engine():
             # Test synthesizing a simple tone
             logger.info("Synthesizing and playing a simple tone (A4)...")
             waveform = engine.synthesize(440.0, 0.5, "sine")
-            engine.play(waveform, 0.7)
-            time.sleep(0.6)
+            engine.play(waveform, 0.7).wait(timeout=2.0)
             
             # Test playing a note by name
             logger.info("Playing a note by name (C4)...")
-            engine.play_note("C4", 0.5, 0.7)
-            time.sleep(0.6)
+            engine.play_note("C4", 0.5, 0.7).wait(timeout=2.0)
             
             # Test playing a chord
             logger.info("Playing a C major chord...")
-            engine.play_chord(["C4", "E4", "G4"], 1.0, 0.7)
-            time.sleep(1.1)
+            engine.play_chord(["C4", "E4", "G4"], 1.0, 0.7).wait(timeout=2.0)
             
             # Test playing a scale
             logger.info("Playing a C major scale...")
-            engine.play_scale("C4", "Major", 0.2, 0.7)
-            time.sleep(2.0)
+            engine.play_scale("C4", "Major", 0.2, 0.7).wait(timeout=2.0)
         else:
             logger.warning("Audio not available, skipping audio playback tests")
         
@@ -128,7 +125,7 @@ def test_component_system():
     logger.info("=== Testing Component System ===")
     
     try:
-        from MetaMindIQTrain.core.component_system import Component, UIComponent, Container, Text, Button
+        from MetaMindIQTrain.core.component_system import Container, Text, Button, mount_component_tree
         
         # Create a simple component hierarchy
         root = Container("root")
@@ -164,7 +161,6 @@ def test_component_system():
         root.add_child(button)
         
         # Mount component tree
-        from MetaMindIQTrain.core.component_system import mount_component_tree
         mount_component_tree(root)
         
         # Verify components are mounted
@@ -221,18 +217,29 @@ def test_module_loading():
         logger.error(f"Module loading test failed: {e}", exc_info=True)
         return False
 
+# Tests by name; each imports what it exercises when it runs
+TESTS = {
+    "renderer": test_renderer,
+    "audio_engine": test_audio_engine,
+    "component_system": test_component_system,
+    "module_loading": test_module_loading,
+}
+
 def main():
-    """Run all tests."""
+    """Run all tests, or only those selected with --only."""
+    parser = argparse.ArgumentParser(description="Test the optimized MetaMindIQTrain components.")
+    parser.add_argument("--only", nargs="+", choices=list(TESTS), metavar="TEST",
+                        help=f"Run only these tests ({', '.join(TESTS)})")
+    args = parser.parse_args()
+    
     logger.info("Starting optimization tests...")
     
     # Track test results
     results = {}
     
-    # Run tests
-    results["renderer"] = test_renderer()
-    results["audio_engine"] = test_audio_engine()
-    results["component_system"] = test_component_system()
-    results["module_loading"] = test_module_loading()
+    # Run tests; unselected tests never import their modules
+    for test_name in args.only or TESTS:
+        results[test_name] = TESTS[test_name]()
     
     # Print summary
     logger.info("\n=== Test Results ===")
@@ -11,8 +11,9 @@ import sys
 import time
 import subprocess
 import argparse
-import threading
+import selectors
 import logging
+from collections import deque
 from pathlib import Path
 
 # Configure logging
@@ -26,9 +27,97 @@ logger = logging.getLogger('TestOptimized')
 script_dir = Path(__file__).resolve().parent
 sys.path.insert(0, str(script_dir))
 
-def run_server(args):
+class OutputLog:
+    """
+    Child output waiting to be forwarded to the log.
+    
+    Complete lines are held in a bounded ring buffer and forwarded together
+    at most every FLUSH_INTERVAL seconds, so a chatty child costs one log
+    call per interval. Lines that overflow the buffer are dropped and counted.
+    """
+    
+    FLUSH_INTERVAL = 0.1
+    MAX_LINES = 10000
+    
+    def __init__(self, label):
+        self.label = label
+        self.partial = bytearray()
+        self.lines = deque(maxlen=self.MAX_LINES)
+        self.dropped = 0
+        self.last_flush = time.monotonic()
+    
+    def feed(self, chunk):
+        """Add raw output, keeping any trailing partial line for later."""
+        self.partial += chunk
+        end = self.partial.rfind(b'\n')
+        if end == -1:
+            return
+        
+        lines = self.partial[:end].split(b'\n')
+        del self.partial[:end + 1]
+        self.dropped += max(0, len(self.lines) + len(lines) - self.MAX_LINES)
+        self.lines.extend(lines)
+    
+    def flush(self, force=False):
+        """Forward buffered lines if the interval has passed, or if forced."""
+        now = time.monotonic()
+        if not force and now - self.last_flush < self.FLUSH_INTERVAL:
+            return
+        self.last_flush = now
+        
+        if force and self.partial:
+            self.lines.append(bytes(self.partial))
+            self.partial.clear()
+        
+        if self.dropped:
+            logger.warning("%s output: %d lines dropped", self.label, self.dropped)
+            self.dropped = 0
+        
+        if self.lines:
+            text = b'\n'.join(self.lines).decode('utf-8', 'replace')
+            self.lines.clear()
+            logger.info("%s output: %s", self.label, text.strip())
+
+def pump_output(selector, timeout=0.1):
+    """
+    Forward whatever child output is ready to the log.
+    
+    Each stream registered with the selector carries an OutputLog. Ready
+    streams are read in bulk; streams at EOF are flushed and unregistered.
+    When INFO logging is off the output is drained without being kept.
+    
+    Args:
+        selector: Selector the child stdout pipes are registered with
+        timeout: Maximum time to wait for output, in seconds
+    """
+    if not selector.get_map():
+        time.sleep(timeout)
+        return
+    
+    log_output = logger.isEnabledFor(logging.INFO)
+    
+    for key, _ in selector.select(timeout):
+        chunk = os.read(key.fd, 65536)
+        if not chunk:
+            selector.unregister(key.fileobj)
+            if log_output:
+                key.data.flush(force=True)
+            continue
+        
+        if log_output:
+            key.data.feed(chunk)
+    
+    if log_output:
+        for key in selector.get_map().values():
+            key.data.flush()
+
+def run_server(args, selector):
     """
     Start the server process.
+    
+    Its output is forwarded to the log by pump_output. Children are started
+    with close_fds=False so subprocess can use posix_spawn rather than
+    fork+exec; descriptors Python opens are non-inheritable anyway.
     """
     server_cmd = [
         sys.executable,
@@ -47,26 +136,24 @@ def run_server(args):
             server_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            bufsize=0,
+            close_fds=False,
             env=dict(os.environ, PYTHONPATH=str(script_dir))
         )
         logger.info("Server started successfully")
         
-        # Start a thread to log server output
-        def log_output():
-            for line in server_process.stdout:
-                logger.info(f"Server output: {line.strip()}")
-        
-        threading.Thread(target=log_output, daemon=True).start()
+        selector.register(server_process.stdout, selectors.EVENT_READ, OutputLog("Server"))
         
         return server_process
     except subprocess.SubprocessError as e:
         logger.error(f"Failed to start server: {e}")
         return None
 
-def run_client(args):
+def run_client(args, selector):
     """
     Start the client process.
+    
+    Its output is forwarded to the log by pump_output.
     """
     client_cmd = [
         sys.executable,
@@ -86,14 +173,13 @@ def run_client(args):
             client_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            bufsize=0,
+            close_fds=False,
             env=dict(os.environ, PYTHONPATH=str(script_dir))
         )
         logger.info("Client started successfully")
         
-        # Log the client's output in real-time
-        for line in client_process.stdout:
-            logger.info(f"Client output: {line.strip()}")
+        selector.register(client_process.stdout, selectors.EVENT_READ, OutputLog("Client"))
         
         return client_process
     except subprocess.SubprocessError as e:
@@ -126,30 +212,37 @@ def main():
     server_process = None
     client_process = None
     
+    # One selector multiplexes the output of both children on this thread
+    selector = selectors.DefaultSelector()
+    
     try:
         # Start server if not client-only
         if not args.client_only:
-            server_process = run_server(args)
+            server_process = run_server(args, selector)
             if not server_process:
                 return 1
             
-            # Give the server time to start up
-            time.sleep(2)
+            # Give the server time to start up, logging its output meanwhile
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline:
+                pump_output(selector, deadline - time.monotonic())
         
         # Start client if not server-only
         if not args.server_only:
-            client_process = run_client(args)
+            client_process = run_client(args, selector)
             if not client_process:
                 return 1
             
-            # Wait for client to finish
+            # Log output until the client closes its stdout, then reap it
+            while client_process.stdout in selector.get_map():
+                pump_output(selector)
             client_process.wait()
             logger.info("Client process terminated")
         else:
             # In server-only mode, wait for keyboard interrupt
             logger.info("Server running. Press Ctrl+C to terminate.")
             while True:
-                time.sleep(1)
+                pump_output(selector, 1)
                 
     except KeyboardInterrupt:
         logger.info("Interrupt received, shutting down...")
@@ -164,6 +257,11 @@ def main():
             logger.info("Terminating server process...")
             server_process.terminate()
             server_process.wait()
+        
+        # Forward whatever is still buffered before exiting
+        for key in selector.get_map().values():
+            key.data.flush(force=True)
+        selector.close()
     
     return 0
 
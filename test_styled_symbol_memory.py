@@ -7,7 +7,6 @@ that matches the HTML/CSS implementation.
 """
 
 import sys
-import time
 import pygame
 from pathlib import Path
 
@@ -20,11 +19,42 @@ from core.theme_manager import ThemeManager
 from core.ui_renderer import UIRenderer
 from core import config
 
+def build_static_background(ui_renderer, screen):
+    """Render the layout and header, which never change, onto a background.
+    
+    Args:
+        ui_renderer: UIRenderer to draw with
+        screen: Display surface the background is sized and formatted for
+        
+    Returns:
+        Surface holding the static UI
+    """
+    # Opaque and in display format so per-frame blits take SDL's copy path
+    static_bg = pygame.Surface(screen.get_size()).convert()
+    
+    # Point the renderer at the background surface while drawing
+    ui_renderer.screen = static_bg
+    try:
+        # Render UI layout
+        ui_renderer.render_layout()
+        
+        # Render header with title
+        ui_renderer.render_header("Symbol Memory", "Memorize the pattern and identify changes")
+    finally:
+        ui_renderer.screen = screen
+    
+    return static_bg
+
 def main():
     """Main entry point for the styled Symbol Memory test."""
     # Initialize pygame
     pygame.init()
     
+    # Only queue the events the loop handles
+    handled_events = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(handled_events)
+    
     # Set up the window based on config
     screen_width, screen_height = config.get_resolution()
     screen = pygame.display.set_mode((screen_width, screen_height))
@@ -42,18 +72,30 @@ def main():
     # Create the UI renderer
     ui_renderer = UIRenderer(screen, screen_width, screen_height)
     
+    # Layout and header are drawn once and blitted every frame
+    static_bg = build_static_background(ui_renderer, screen)
+    
+    # The grid is drawn in the content area and the buttons in the footer,
+    # so both are redrawn every frame; text rects are added as drawn
+    live_rects = [
+        pygame.Rect(*config.get_content_rect(screen_width, screen_height)),
+        pygame.Rect(*config.get_footer_rect(screen_width, screen_height)),
+    ]
+    
+    # After the first full frame only the changed areas are restored and
+    # presented
+    full_redraw = True
+    dirty_rects = []
+    
     # Game loop
     running = True
-    last_time = time.time()
     
     while running:
-        # Calculate dt
-        current_time = time.time()
-        dt = current_time - last_time
-        last_time = current_time
+        # Limit FPS; the elapsed milliseconds double as dt
+        dt = clock.tick(config.DISPLAY_CONFIG["fps_limit"]) / 1000.0
         
         # Process events
-        for event in pygame.event.get():
+        for event in pygame.event.get(handled_events):
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -67,14 +109,13 @@ def main():
         # Update module state
         module.update(dt)
         
-        # Clear the screen
-        screen.fill(config.UI_THEME["colors"]["bg_dark"])
-        
-        # Render UI layout
-        ui_renderer.render_layout()
-        
-        # Render header with title
-        ui_renderer.render_header("Symbol Memory", "Memorize the pattern and identify changes")
+        # Restore the layout and header under last frame's drawing
+        if full_redraw:
+            screen.blit(static_bg, (0, 0))
+        else:
+            for rect in dirty_rects:
+                screen.blit(static_bg, rect, rect)
+        drawn_rects = list(live_rects)
         
         # Get current module state
         state = module.get_state()
@@ -87,7 +128,7 @@ def main():
         
         # Display score
         score_text = f"Score: {state.get('score', 0)}"
-        ui_renderer.render_text_with_shadow(
+        score_rect = ui_renderer.render_text_with_shadow(
             score_text,
             (screen_width - 100, 30),
             font_key="regular",
@@ -96,7 +137,7 @@ def main():
         
         # Display level
         level_text = f"Level: {state.get('difficulty', 1)}"
-        ui_renderer.render_text_with_shadow(
+        level_rect = ui_renderer.render_text_with_shadow(
             level_text,
             (screen_width - 100, 60),
             font_key="regular",
@@ -104,20 +145,28 @@ def main():
         )
         
         # Debugging info
+        # Whole frames per second keep the FPS label in the text cache
         fps = clock.get_fps()
-        ui_renderer.render_text(
-            f"FPS: {fps:.1f}",
+        fps_rect = ui_renderer.render_text(
+            f"FPS: {int(fps)}",
             (10, screen_height - 20),
             font_key="small",
             color=config.UI_THEME["colors"]["text_dark"],
             align="left"
         )
         
-        # Update display
-        pygame.display.flip()
+        # The shadow is drawn 2px down and right of the text
+        drawn_rects.append(score_rect.inflate(4, 4))
+        drawn_rects.append(level_rect.inflate(4, 4))
+        drawn_rects.append(fps_rect)
         
-        # Limit FPS
-        clock.tick(config.DISPLAY_CONFIG["fps_limit"])
+        # Update display
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty_rects + drawn_rects)
+        dirty_rects = drawn_rects
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
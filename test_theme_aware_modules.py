@@ -9,8 +9,9 @@ with consistent styling and resolution independence.
 import os
 import sys
 import pygame
-import time
 import logging
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 
 # Add the project root to the Python path if needed
@@ -52,6 +53,13 @@ class ModuleTest:
     STATE_MODULE_SELECTION = 0
     STATE_MODULE_RUNNING = 1
     
+    # Event types handle_events responds to
+    HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+    
+    # Longest step handed to a module, so one slow frame does not make the
+    # next update jump ahead
+    MAX_DELTA_TIME = 0.1
+    
     def __init__(self):
         """Initialize the module test."""
         self.init_pygame()
@@ -63,18 +71,28 @@ class ModuleTest:
         self.active_module = None
         self.active_module_type = -1
         
-        # Time tracking
-        self.prev_time = time.time()
-        self.current_time = time.time()
+        # Whether the next frame needs rendering; the selection screen is
+        # static, so idle frames there skip rendering entirely
+        self._dirty = True
+        
+        # Screen areas drawn by the last running-module frame, and whether the
+        # next one must repaint the whole screen instead of just those areas
+        self._drawn_rects = []
+        self._full_redraw = True
         
         # Initialize scaling helper
         self.scaling_helper = ScalingHelper()
         self.scaling_helper.update_scale_factors(self.width, self.height, 1440, 1024)
+        self._recompute_scaled()
     
     def init_pygame(self):
         """Initialize pygame and create the display."""
         pygame.init()
         
+        # Only queue the events the test handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
+        
         # Set up the display (use native resolution, but default to 1440x1024)
         info = pygame.display.Info()
         self.width = info.current_w
@@ -85,13 +103,30 @@ class ModuleTest:
         pygame.display.set_caption("MetaMindIQTrain - Theme-Aware Cognitive Modules")
         
         # Create font cache
-        self.fonts = {}
+        self.fonts = OrderedDict()
+        self._font_cache_size = 32
+        
+        # Rendered text surfaces keyed by (text, font_size, color), LRU ordered
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 512
+        
+        # Rasterized circles keyed by (radius, fill, border width, border color)
+        self._circle_cache = OrderedDict()
+        self._circle_cache_size = 128
     
     def get_font(self, size):
         """Get a font of the specified size."""
-        if size not in self.fonts:
-            self.fonts[size] = pygame.font.SysFont("Arial", size)
-        return self.fonts[size]
+        fonts = self.fonts
+        font = fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont("Arial", size)
+            fonts[size] = font
+            # Evicting drops the last reference, which closes the font file
+            if len(fonts) > self._font_cache_size:
+                fonts.popitem(last=False)
+        else:
+            fonts.move_to_end(size)
+        return font
     
     def init_themes(self):
         """Initialize and register themes."""
@@ -191,12 +226,45 @@ class ModuleTest:
         # Register module-specific styles
         register_cognitive_module_styles(self.dark_theme)
         register_cognitive_module_styles(self.light_theme)
+        
+        # Map theme colors to the display's pixel format up front
+        self._mapped_colors = {}
+        for theme in (self.dark_theme, self.light_theme):
+            for color in theme.colors.values():
+                self._map_color(color)
+    
+    def _map_color(self, color):
+        """Get a color as a display pixel value, mapping each color only once."""
+        key = tuple(color)
+        mapped = self._mapped_colors.get(key)
+        if mapped is None:
+            mapped = self._mapped_colors[key] = self.screen.map_rgb(key)
+        return mapped
     
     def init_ui(self):
         """Initialize the UI components."""
         self.ui = UI()
         self.component_factory = ComponentFactory(self.theme_provider)
         
+        # Module selection components, built on first use
+        self._selection_components = None
+        
+        # Pre-rendered selection screen per theme id
+        self._selection_surfaces = {}
+        
+        # One Rect per drawn component, dropped along with the component;
+        # Component is slotted, so the Rect can't live on it
+        self._component_rects = weakref.WeakKeyDictionary()
+        
+        # Component renderers by component type
+        self._renderers = {
+            "rectangle": self.render_rectangle,
+            "text": self.render_text,
+            "circle": self.render_circle,
+            "button": self.render_button,
+            "container": self._render_container,
+        }
+        
         # No active module initially
         self.active_module = None
     
@@ -209,15 +277,56 @@ class ModuleTest:
             self.theme_provider.theme = self.dark_theme
             logger.info("Switched to dark theme")
         
+        self._dirty = True
+        self._full_redraw = True
+        
+        # Text colors change with the theme
+        self._text_cache.clear()
+        
         # If a module is active, update its theme
         if self.active_module:
             self.active_module.theme_provider = self.theme_provider
             self.active_module.build_ui()
     
+    def _recompute_scaled(self):
+        """Scale the module selection layout metrics for the current resolution.
+        
+        Call again after the scale factors change.
+        """
+        scale = self.scaling_helper.scale_value
+        self._title_y = scale(80)
+        self._subtitle_y = scale(140)
+        self._instructions_y = scale(200)
+        self._exit_margin = scale(50)
+        self._button_width = scale(300)
+        self._button_height = scale(80)
+        self._button_spacing = scale(40)
+        self._buttons_top = scale(300)
+    
     def build_module_selection_ui(self):
-        """Build the module selection UI."""
-        # Clear existing UI
+        """Build the module selection UI.
+        
+        The components are created on the first call; later calls (theme
+        toggles, returning from a module) only restyle them.
+        """
+        if self._selection_components is None:
+            self._build_selection_components()
+        self._apply_theme_to_selection()
+    
+    def _build_selection_components(self):
+        """Create the module selection components and add them to the UI."""
+        theme = self.theme_provider.theme
         self.ui = UI()
+        self._selection_surfaces.clear()
+        
+        # Components in draw order, and the style key each one uses
+        self._selection_components = []
+        self._selection_style_keys = []
+        
+        def add(component, style_key):
+            self.ui.add_component(component)
+            self._selection_components.append(component)
+            self._selection_style_keys.append(style_key)
         
         # Main container
         container = Component(
@@ -225,40 +334,39 @@ class ModuleTest:
             position=(0, 0),
             width=self.width,
             height=self.height,
-            style=self.theme_provider.theme.get_style("common.container")
+            style=theme.get_style("common.container")
         )
-        self.ui.add_component(container)
+        add(container, "common.container")
         
         # Title
         title = Component(
             type="text",
             text="MetaMindIQTrain - Theme-Aware Cognitive Modules",
-            position=(self.width/2, self.scaling_helper.scale_value(80)),
-            style=self.theme_provider.theme.get_style("common.title"),
+            position=(self.width/2, self._title_y),
+            style=theme.get_style("common.title"),
             align="center"
         )
-        self.ui.add_component(title)
+        add(title, "common.title")
         
-        # Subtitle with theme info
-        theme_name = "Dark Theme" if self.theme_provider.theme.id == "dark" else "Light Theme"
-        subtitle = Component(
+        # Subtitle with theme info; its text is set per theme
+        self._selection_subtitle = Component(
             type="text",
-            text=f"Current Theme: {theme_name} (Press T to toggle)",
-            position=(self.width/2, self.scaling_helper.scale_value(140)),
-            style=self.theme_provider.theme.get_style("common.subtitle"),
+            text="",
+            position=(self.width/2, self._subtitle_y),
+            style=theme.get_style("common.subtitle"),
             align="center"
         )
-        self.ui.add_component(subtitle)
+        add(self._selection_subtitle, "common.subtitle")
         
         # Module selection instructions
         instructions = Component(
             type="text",
             text="Select a cognitive training module to test:",
-            position=(self.width/2, self.scaling_helper.scale_value(200)),
-            style=self.theme_provider.theme.get_style("common.instruction"),
+            position=(self.width/2, self._instructions_y),
+            style=theme.get_style("common.instruction"),
             align="center"
         )
-        self.ui.add_component(instructions)
+        add(instructions, "common.instruction")
         
         # Available modules
         modules = [
@@ -277,10 +385,15 @@ class ModuleTest:
             })
         
         # Calculate button dimensions and placement
-        button_width = self.scaling_helper.scale_value(300)
-        button_height = self.scaling_helper.scale_value(80)
-        spacing = self.scaling_helper.scale_value(40)
-        start_y = self.scaling_helper.scale_value(300)
+        button_width = self._button_width
+        button_height = self._button_height
+        spacing = self._button_spacing
+        start_y = self._buttons_top
+        
+        # Styles shared by every button
+        button_style = theme.get_style("common.button")
+        button_text_style = theme.get_style("common.button_text")
+        button_desc_style = theme.get_style("common.button_description")
         
         # Module selection buttons
         self.module_buttons = []
@@ -296,29 +409,29 @@ class ModuleTest:
                 position=(button_x, button_y),
                 width=button_width,
                 height=button_height,
-                style=self.theme_provider.theme.get_style("common.button")
+                style=button_style
             )
-            self.ui.add_component(button)
+            add(button, "common.button")
             
             # Button text
             text = Component(
                 type="text",
                 text=module["name"],
                 position=(button_x + button_width/2, button_y + button_height/3),
-                style=self.theme_provider.theme.get_style("common.button_text"),
+                style=button_text_style,
                 align="center"
             )
-            self.ui.add_component(text)
+            add(text, "common.button_text")
             
             # Button description
             desc = Component(
                 type="text",
                 text=module["description"],
                 position=(button_x + button_width/2, button_y + button_height*2/3),
-                style=self.theme_provider.theme.get_style("common.button_description"),
+                style=button_desc_style,
                 align="center"
             )
-            self.ui.add_component(desc)
+            add(desc, "common.button_description")
             
             # Store button bounds and module type for click detection
             self.module_buttons.append({
@@ -326,15 +439,30 @@ class ModuleTest:
                 "type": module["type"]
             })
         
+        # Click targets as Rects so hit-testing is a single C-level scan
+        self._button_rects = [pygame.Rect(button["rect"]) for button in self.module_buttons]
+        
         # Exit instructions
         exit_instructions = Component(
             type="text",
             text="Press ESC to exit",
-            position=(self.width/2, self.height - self.scaling_helper.scale_value(50)),
-            style=self.theme_provider.theme.get_style("common.instruction"),
+            position=(self.width/2, self.height - self._exit_margin),
+            style=theme.get_style("common.instruction"),
             align="center"
         )
-        self.ui.add_component(exit_instructions)
+        add(exit_instructions, "common.instruction")
+    
+    def _apply_theme_to_selection(self):
+        """Point the module selection components at the current theme's styles."""
+        theme = self.theme_provider.theme
+        
+        # Look up each distinct style once; buttons share theirs
+        styles = {key: theme.get_style(key) for key in set(self._selection_style_keys)}
+        for component, style_key in zip(self._selection_components, self._selection_style_keys):
+            component.set_property("style", styles[style_key])
+        
+        theme_name = "Dark Theme" if theme.id == "dark" else "Light Theme"
+        self._selection_subtitle.set_property("text", f"Current Theme: {theme_name} (Press T to toggle)")
     
     def launch_module(self, module_type):
         """Launch the selected cognitive module.
@@ -363,6 +491,7 @@ class ModuleTest:
         
         # Update state
         if self.active_module:
+            self._dirty = True
             self.active_module_type = module_type
             self.state = self.STATE_MODULE_RUNNING
             
@@ -374,11 +503,12 @@ class ModuleTest:
         self.active_module = None
         self.active_module_type = -1
         self.state = self.STATE_MODULE_SELECTION
+        self._dirty = True
         self.build_module_selection_ui()
     
     def handle_events(self):
         """Handle pygame events."""
-        for event in pygame.event.get():
+        for event in pygame.event.get(self.HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             
@@ -411,17 +541,15 @@ class ModuleTest:
                         self.active_module.handle_key_press(event.unicode)
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._dirty = True
                 if event.button == 1:  # Left click
                     mouse_pos = pygame.mouse.get_pos()
                     
                     if self.state == self.STATE_MODULE_SELECTION:
                         # Check if a module button was clicked
-                        for button in self.module_buttons:
-                            rect = button["rect"]
-                            if (rect[0] <= mouse_pos[0] <= rect[0] + rect[2] and
-                                rect[1] <= mouse_pos[1] <= rect[1] + rect[3]):
-                                self.launch_module(button["type"])
-                                break
+                        index = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._button_rects)
+                        if index != -1:
+                            self.launch_module(self.module_buttons[index]["type"])
                     
                     elif self.state == self.STATE_MODULE_RUNNING and self.active_module:
                         # Pass click to active module
@@ -429,32 +557,104 @@ class ModuleTest:
         
         return True
     
-    def update(self):
-        """Update game state."""
-        # Calculate delta time
-        self.current_time = time.time()
-        delta_time = self.current_time - self.prev_time
-        self.prev_time = self.current_time
+    def update(self, delta_time):
+        """Update game state.
         
+        Args:
+            delta_time: Seconds since the previous frame
+        """
         # Update active module if any
         if self.state == self.STATE_MODULE_RUNNING and self.active_module:
             self.active_module.update(delta_time)
+            
+            # Running modules animate, so every frame is redrawn
+            self._dirty = True
     
     def render(self):
         """Render the current state to the screen."""
-        # Clear screen
-        self.screen.fill(self.theme_provider.theme.get_color("background"))
+        screen = self.screen
+        background = self._map_color(self.theme_provider.theme.get_color("background"))
         
-        if self.state == self.STATE_MODULE_SELECTION:
-            # Render module selection UI
-            self.render_ui(self.ui)
+        if self.state == self.STATE_MODULE_RUNNING and self.active_module:
+            self._render_module_frame(screen, background)
+            return
         
-        elif self.state == self.STATE_MODULE_RUNNING and self.active_module:
-            # Render active module UI
-            self.render_ui(self.active_module.ui)
+        if self.state == self.STATE_MODULE_SELECTION:
+            # The selection screen is static, so it is drawn once per theme
+            # and presented with a single blit
+            theme_id = self.theme_provider.theme.id
+            selection_surface = self._selection_surfaces.get(theme_id)
+            if selection_surface is None:
+                selection_surface = self._render_selection_surface(background)
+                self._selection_surfaces[theme_id] = selection_surface
+            screen.blit(selection_surface, (0, 0))
+        else:
+            # Clear screen
+            screen.fill(background)
         
         # Update the display
         pygame.display.flip()
+        
+        # The first module frame after this must repaint everything
+        self._full_redraw = True
+    
+    def _render_selection_surface(self, background):
+        """Render the module selection UI onto an off-screen surface.
+        
+        Args:
+            background: Theme background color
+            
+        Returns:
+            Opaque surface in display format holding the selection screen
+        """
+        selection_surface = pygame.Surface(self.screen.get_size()).convert()
+        selection_surface.fill(background)
+        
+        # Point the render helpers at the surface while drawing
+        target = self.screen
+        self.screen = selection_surface
+        try:
+            self.render_ui(self.ui)
+        finally:
+            self.screen = target
+            self._drawn_rects = []
+        
+        return selection_surface
+    
+    def _render_module_frame(self, screen, background):
+        """Render the active module, presenting only the areas that changed.
+        
+        Only the areas drawn last frame are cleared; every component is then
+        redrawn and the union of old and new areas is pushed to the display,
+        falling back to a full flip when that covers half the screen or more.
+        
+        Args:
+            screen: Display surface
+            background: Theme background color
+        """
+        previous = self._drawn_rects
+        self._drawn_rects = []
+        
+        if self._full_redraw:
+            screen.fill(background)
+        else:
+            for rect in previous:
+                screen.fill(background, rect)
+        
+        # Render active module UI
+        self.render_ui(self.active_module.ui)
+        
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+            return
+        
+        dirty_rects = previous + self._drawn_rects
+        dirty_area = sum(rect.w * rect.h for rect in dirty_rects)
+        if dirty_area < 0.5 * self.width * self.height:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
     
     def render_ui(self, ui):
         """Render UI components to the screen.
@@ -462,67 +662,90 @@ class ModuleTest:
         Args:
             ui: UI object containing components to render
         """
-        components = ui.to_dict().get("components", [])
+        self._render_components(ui.components)
+    
+    def _render_components(self, components):
+        """Render component objects directly, without serializing them.
         
+        Args:
+            components: Iterable of components to render
+        """
+        renderers = self._renderers
         for component in components:
-            component_type = component.get("type")
-            
-            if component_type == "rectangle":
-                self.render_rectangle(component)
-            elif component_type == "text":
-                self.render_text(component)
-            elif component_type == "circle":
-                self.render_circle(component)
-            elif component_type == "button":
-                self.render_button(component)
-            elif component_type == "container":
-                self.render_rectangle(component)
-                # Render children if any
-                children = component.get("children", [])
-                if children:
-                    child_ui = UI()
-                    child_ui.set_from_dict({"components": children})
-                    self.render_ui(child_ui)
+            renderer = renderers.get(component.type)
+            if renderer is not None:
+                renderer(component)
+    
+    def _render_container(self, component):
+        """Render a container component and its children."""
+        self.render_rectangle(component)
+        
+        # Render children if any
+        children = getattr(component, "children", None)
+        if children:
+            self._render_components(children)
     
     def render_rectangle(self, component):
         """Render a rectangle component."""
-        position = component.get("position", (0, 0))
-        width = component.get("width", 100)
-        height = component.get("height", 100)
-        style = component.get("style", {})
+        position = component.position
+        width = component.properties.get("width", 100)
+        height = component.properties.get("height", 100)
+        style = component.properties.get("style") or {}
         
-        bg_color = style.get("backgroundColor", (100, 100, 100))
+        bg_color = self._map_color(style.get("backgroundColor", (100, 100, 100)))
         border_width = style.get("borderWidth", 0)
-        border_color = style.get("borderColor", (0, 0, 0))
+        border_color = self._map_color(style.get("borderColor", (0, 0, 0)))
         border_radius = style.get("borderRadius", 0)
         
-        rect = pygame.Rect(position[0], position[1], width, height)
+        # Keep one Rect per component and update it in place
+        rect = self._component_rects.get(component)
+        if rect is None:
+            rect = self._component_rects[component] = pygame.Rect(position[0], position[1], width, height)
+        else:
+            rect.update(position[0], position[1], width, height)
         
         # Draw with border radius if supported
         if border_radius > 0:
-            pygame.draw.rect(self.screen, bg_color, rect, 0, border_radius)
+            drawn = pygame.draw.rect(self.screen, bg_color, rect, 0, border_radius)
             if border_width > 0:
                 pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius)
         else:
-            pygame.draw.rect(self.screen, bg_color, rect)
+            drawn = pygame.draw.rect(self.screen, bg_color, rect)
             if border_width > 0:
                 pygame.draw.rect(self.screen, border_color, rect, border_width)
+        self._drawn_rects.append(drawn)
     
     def render_text(self, component):
         """Render a text component."""
-        text = component.get("text", "")
-        position = component.get("position", (0, 0))
-        style = component.get("style", {})
-        align = component.get("align", "left")
-        
-        color = style.get("color", (255, 255, 255))
-        font_size = style.get("fontSize", 20)
-        
-        # Get font
-        font = self.get_font(font_size)
-        
-        # Render text
-        text_surface = font.render(str(text), True, color)
+        style = component.properties.get("style") or {}
+        self._draw_text(
+            component.properties.get("text", ""),
+            component.position,
+            style.get("color", (255, 255, 255)),
+            style.get("fontSize", 20),
+            component.properties.get("align", "left")
+        )
+    
+    def _get_text_surface(self, text, font_size, color):
+        """Get the rendered surface for a string, rasterizing it only once."""
+        if text.__class__ is not str:
+            text = str(text)
+        text_cache = self._text_cache
+        key = (text, font_size, tuple(color))
+        text_surface = text_cache.get(key)
+        if text_surface is None:
+            # Convert once to the display format so cached blits skip conversion
+            text_surface = self.get_font(font_size).render(text, True, color).convert_alpha()
+            text_cache[key] = text_surface
+            if len(text_cache) > self._text_cache_size:
+                text_cache.popitem(last=False)
+        else:
+            text_cache.move_to_end(key)
+        return text_surface
+    
+    def _draw_text(self, text, position, color, font_size, align):
+        """Draw a string at a position with the given color, size and alignment."""
+        text_surface = self._get_text_surface(text, font_size, color)
         
         # Adjust position based on alignment
         x, y = position
@@ -532,52 +755,66 @@ class ModuleTest:
             x -= text_surface.get_width()
         
         # Draw text
-        self.screen.blit(text_surface, (x, y))
+        self._drawn_rects.append(self.screen.blit(text_surface, (x, y)))
     
     def render_circle(self, component):
         """Render a circle component."""
-        position = component.get("position", (0, 0))
-        radius = component.get("radius", 10)
-        style = component.get("style", {})
+        position = component.position
+        radius = component.properties.get("radius", 10)
+        style = component.properties.get("style") or {}
         
         bg_color = style.get("backgroundColor", (100, 100, 100))
         border_width = style.get("borderWidth", 0)
         border_color = style.get("borderColor", (0, 0, 0))
         
-        # Draw filled circle
-        pygame.draw.circle(self.screen, bg_color, position, radius)
+        # Rasterize each distinct circle once, then blit it
+        circle_cache = self._circle_cache
+        key = (radius, tuple(bg_color), border_width, tuple(border_color))
+        circle_surface = circle_cache.get(key)
+        if circle_surface is None:
+            circle_surface = self._rasterize_circle(radius, bg_color, border_width, border_color)
+            circle_cache[key] = circle_surface
+            if len(circle_cache) > self._circle_cache_size:
+                circle_cache.popitem(last=False)
+        else:
+            circle_cache.move_to_end(key)
         
-        # Draw border if needed
+        half = circle_surface.get_width() // 2
+        self._drawn_rects.append(
+            self.screen.blit(circle_surface, (position[0] - half, position[1] - half))
+        )
+    
+    def _rasterize_circle(self, radius, bg_color, border_width, border_color):
+        """Draw a filled circle and its border onto a new transparent surface."""
+        half = int(radius) + 1
+        circle_surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        pygame.draw.circle(circle_surface, bg_color, (half, half), radius)
         if border_width > 0:
-            pygame.draw.circle(self.screen, border_color, position, radius, border_width)
+            pygame.draw.circle(circle_surface, border_color, (half, half), radius, border_width)
+        return circle_surface.convert_alpha()
     
     def render_button(self, component):
         """Render a button component (rectangle with text)."""
         # Render button background (as rectangle)
         self.render_rectangle(component)
         
-        # Extract text from component
-        text = component.get("text", "")
-        position = component.get("position", (0, 0))
-        width = component.get("width", 100)
-        height = component.get("height", 50)
-        style = component.get("style", {})
-        
-        # Text color and properties
-        text_color = style.get("textColor", (255, 255, 255))
-        font_size = style.get("fontSize", 20)
-        
-        # Create text component
-        text_component = {
-            "type": "text",
-            "text": text,
-            "position": (position[0] + width // 2, position[1] + height // 2),
-            "style": {"color": text_color, "fontSize": font_size},
-            "align": "center"
-        }
-        
-        # Render text
-        self.render_text(text_component)
+        # Label goes at the middle of the rect just drawn
+        rect = self._component_rects[component]
+        style = component.properties.get("style") or {}
+        self._blit_centered_text(
+            component.properties.get("text", ""),
+            rect.centerx,
+            rect.centery,
+            style.get("textColor", (255, 255, 255)),
+            style.get("fontSize", 20)
+        )
+    
+    def _blit_centered_text(self, text, cx, y, color, font_size):
+        """Draw a string horizontally centered on cx with its top at y."""
+        text_surface = self._get_text_surface(text, font_size, color)
+        self._drawn_rects.append(
+            self.screen.blit(text_surface, (cx - text_surface.get_width() // 2, y))
+        )
     
     def run(self):
         """Main game loop."""
@@ -589,17 +826,19 @@ class ModuleTest:
         clock = pygame.time.Clock()
         
         while running:
+            # Cap at 60 FPS; the elapsed milliseconds double as delta time
+            delta_time = min(clock.tick(60) / 1000.0, self.MAX_DELTA_TIME)
+            
             # Handle events
             running = self.handle_events()
             
             # Update game state
-            self.update()
-            
-            # Render to screen
-            self.render()
+            self.update(delta_time)
             
-            # Cap at 60 FPS
-            clock.tick(60)
+            # Render to screen, only when something changed
+            if self._dirty:
+                self.render()
+                self._dirty = False
         
         # Clean up
         pygame.quit()
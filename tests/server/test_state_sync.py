@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+State Synchronization Tests for MetaMindIQTrain.
+
+Checks that the delta wire format round-trips: computed deltas (with and
+without interned field ids) rebuild the current state when applied, and
+prepare_update payloads survive compression, decoding and apply.
+"""
+
+import copy
+import importlib.util
+import random
+import sys
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+project_root = Path(__file__).parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Load state_sync from its file; the server package __init__ imports the
+# full servers, which this module doesn't need
+_spec = importlib.util.spec_from_file_location(
+    "state_sync", project_root / "server" / "state_sync.py"
+)
+state_sync = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(state_sync)
+
+StateSynchronizer = state_sync.StateSynchronizer
+DELTA_SET = state_sync.DELTA_SET
+DELTA_DELETE = state_sync.DELTA_DELETE
+
+# Keys mixing interned field names with ones outside the registry
+KEYS = list(state_sync.STATE_FIELD_NAMES[:12]) + ['alpha', 'beta', 'gamma', 'delta']
+
+
+def random_value(rng, depth):
+    """Build a random JSON-like value, nesting dicts up to depth levels."""
+    roll = rng.random()
+    if depth > 0 and roll < 0.35:
+        return random_state(rng, depth - 1)
+    if roll < 0.55:
+        return rng.randint(-1000, 1000)
+    if roll < 0.75:
+        return rng.choice(['', 'a', 'on', 'off', 'level'])
+    if roll < 0.9:
+        return [rng.randint(0, 9) for _ in range(rng.randint(0, 4))]
+    return rng.choice([True, False, None])
+
+
+def random_state(rng, depth=3):
+    """Build a random state dict."""
+    return {key: random_value(rng, depth)
+            for key in rng.sample(KEYS, rng.randint(0, 6))}
+
+
+def mutate(rng, state, depth=3):
+    """Return a copy of state with random keys set, replaced or removed."""
+    state = copy.deepcopy(state)
+    for _ in range(rng.randint(0, 4)):
+        node = state
+        for _ in range(rng.randint(0, depth)):
+            children = [value for value in node.values() if isinstance(value, dict)]
+            if not children:
+                break
+            node = rng.choice(children)
+        key = rng.choice(KEYS)
+        if key in node and rng.random() < 0.3:
+            del node[key]
+        else:
+            node[key] = random_value(rng, 1)
+    return state
+
+
+class DeltaRoundTripTests(unittest.TestCase):
+    """Tests that compute_delta and apply_delta rebuild the current state."""
+    
+    def setUp(self):
+        """Set up test case."""
+        self.sync = StateSynchronizer()
+        self.rng = random.Random(1234)
+    
+    def test_round_trip(self):
+        """Applying a plain delta to the previous state gives the current one."""
+        for _ in range(500):
+            previous = random_state(self.rng)
+            current = mutate(self.rng, previous)
+            snapshot = copy.deepcopy(previous)
+            
+            delta = self.sync.compute_delta(previous, current)
+            result = self.sync.apply_delta(previous, delta)
+            
+            self.assertEqual(result, current)
+            # Copy-on-write apply must leave the base state untouched
+            self.assertEqual(previous, snapshot)
+    
+    def test_round_trip_interned(self):
+        """Interned deltas round-trip once their paths are decoded."""
+        for _ in range(500):
+            previous = random_state(self.rng)
+            current = mutate(self.rng, previous)
+            
+            delta = self.sync.compute_delta(previous, current, intern_fields=True)
+            result = self.sync.apply_delta(previous, self.sync.decode_delta(delta))
+            
+            self.assertEqual(result, current)
+    
+    def test_interned_paths_use_field_ids(self):
+        """Known field names are sent as ids, other keys as strings."""
+        delta = self.sync.compute_delta({'score': 1}, {'score': 2, 'alpha': 3},
+                                        intern_fields=True)
+        
+        paths = [tuple(path) for _, path, _ in delta]
+        self.assertCountEqual(paths, [(self.sync.field_registry['score'],), ('alpha',)])
+    
+    def test_delete(self):
+        """Keys missing from the current state become DELTA_DELETE ops."""
+        previous = {'game': {'score': 5, 'level': 2}, 'message': 'hi'}
+        current = {'game': {'score': 5}}
+        
+        delta = self.sync.compute_delta(previous, current)
+        
+        self.assertCountEqual(delta, [
+            (DELTA_DELETE, ('game', 'level'), None),
+            (DELTA_DELETE, ('message',), None),
+        ])
+        self.assertEqual(self.sync.apply_delta(previous, delta), current)
+    
+    def test_unchanged_state_gives_empty_delta(self):
+        """Equal or identical states produce no ops."""
+        state = {'game': {'score': 5}, 'message': 'hi'}
+        
+        self.assertEqual(self.sync.compute_delta(state, state), [])
+        self.assertEqual(self.sync.compute_delta(state, copy.deepcopy(state)), [])
+        self.assertIs(self.sync.apply_delta(state, []), state)
+    
+    def test_matching_fingerprints_skip_subtrees(self):
+        """Top-level keys with equal fingerprints are not diffed."""
+        previous = {'game': {'score': 1}, 'message': 'a'}
+        current = {'game': {'score': 2}, 'message': 'b'}
+        
+        delta = self.sync.compute_delta(previous, current,
+                                        {'game': 7, 'message': 1},
+                                        {'game': 7, 'message': 2})
+        
+        self.assertEqual(delta, [(DELTA_SET, ('message',), 'b')])
+
+
+class PrepareUpdateTests(unittest.TestCase):
+    """Tests for the prepare_update -> decompress -> apply pipeline."""
+    
+    def _run_pipeline(self, sync, steps=200):
+        """Send a series of random states and rebuild them as a client would."""
+        rng = random.Random(42)
+        client_state = {}
+        current = random_state(rng)
+        
+        for step in range(steps):
+            current = mutate(rng, current)
+            payload, is_delta, _ = sync.prepare_update('client', current, now=float(step))
+            if payload is None:
+                # Suppressed updates only happen when nothing changed
+                self.assertEqual(client_state, current)
+                continue
+            
+            data, is_compressed = sync.compress_data(payload)
+            message = sync.decompress_data(data, is_compressed)
+            
+            self.assertEqual(message['_meta']['is_delta'], is_delta)
+            if is_delta:
+                client_state = sync.apply_delta(client_state, sync.decode_delta(message['ops']))
+            else:
+                client_state = message['state']
+            self.assertEqual(client_state, current)
+    
+    def test_pipeline(self):
+        """Every update rebuilds the server's state on the client."""
+        sync = StateSynchronizer(compression_threshold=0, send_full_state_interval=7)
+        self._run_pipeline(sync)
+        
+        stats = sync.get_statistics()
+        self.assertGreater(stats['delta_updates'], 0)
+        self.assertGreater(stats['full_updates'], 0)
+        self.assertEqual(stats['compressed_updates'], stats['total_updates'])
+    
+    def test_unchanged_state_is_suppressed(self):
+        """A delta with no ops is not sent."""
+        sync = StateSynchronizer()
+        state = {'game': {'score': 1}}
+        
+        first, is_delta, _ = sync.prepare_update('client', state)
+        self.assertIsNotNone(first)
+        self.assertFalse(is_delta)
+        
+        payload, is_delta, _ = sync.prepare_update('client', copy.deepcopy(state))
+        self.assertIsNone(payload)
+        self.assertTrue(is_delta)
+        self.assertEqual(sync.stats['suppressed_updates'], 1)
+    
+    def test_same_revision_is_suppressed(self):
+        """A revision the client already has is not sent again."""
+        sync = StateSynchronizer()
+        
+        sync.prepare_update('client', {'score': 1}, revision=3)
+        payload, _, _ = sync.prepare_update('client', {'score': 2}, revision=3)
+        
+        self.assertIsNone(payload)
+    
+    def test_zlib_fallback(self):
+        """Without zstandard, payloads are zlib streams and still round-trip."""
+        with mock.patch.object(state_sync, 'HAS_ZSTD', False):
+            sync = StateSynchronizer(compression_threshold=0, send_full_state_interval=7)
+            
+            payload, _, _ = sync.prepare_update('probe', {'message': 'x' * 200})
+            data, is_compressed = sync.compress_data(payload)
+            self.assertTrue(is_compressed)
+            self.assertEqual(zlib.decompress(data), payload)
+            
+            self._run_pipeline(sync)
+
+
+if __name__ == '__main__':
+    unittest.main()